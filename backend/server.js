@@ -11,6 +11,10 @@ import path from 'path';
 const CONTRACT_ADDRESS = process.env.CONTRACT_ADDRESS || '0x68850c902d8193fa29419e3a3a043054d416CA08';
 const OPERATOR_KEY     = process.env.OPERATOR_PRIVATE_KEY || '0xa7db0893b5433f384c92669e3d54b7106e069a8d3cff415ee31affebdfa6b0bc';
 const PORT             = process.env.PORT || 3001;
+const AI_QUESTIONS_MODE = process.env.AI_QUESTIONS_MODE || 'leader'; // consensus mode for generate_ai_questions
+const JUDGE_ON_SUBMIT = process.env.JUDGE_ON_SUBMIT === '1'; // AI-score each answer as it arrives instead of all at round close
+const ROUND_SECONDS = 30; // must match ROUND_SECONDS in the contract: rounds are scored after this even if someone never answers
+const JUDGE_ATTEMPTS = 3; // judge_round tries per round before it's left for the end-of-game pass
 const STUDIO_RPC = 'https://studio.genlayer.com/api';
 const LEADERBOARD_FILE = './leaderboard.json';
 
@@ -68,109 +72,6 @@ function updateLeaderboard(ranking, nicknames) {
   console.log('🏆 Leaderboard updated and saved to disk:', globalLeaderboard);
 }
 
-// ── 50 TRIVIA STATEMENTS WITH DIFFICULTY ─────────────────────────────────────
-// difficulty: 'easy' | 'medium' | 'hard'
-// speedBonus: max bonus XP for fastest correct answer (added on top of base 50)
-
-const ALL_STATEMENTS = [
-  // ── EASY (well-known facts, common myths) ───────────────────────────────────
-  { statement: "The Great Wall of China is not visible from space with the naked eye.", answer: "TRUE", explanation: "Despite the myth, the wall is too narrow (~15 feet wide) to see from orbit without aid.", difficulty: "easy", speedMax: 15 },
-  { statement: "Honey never expires — archaeologists found 3000-year-old honey in Egyptian tombs that was still edible.", answer: "TRUE", explanation: "Honey's low moisture and acidic pH prevent bacterial growth, making it last indefinitely if sealed.", difficulty: "easy", speedMax: 15 },
-  { statement: "Octopuses have three hearts and blue blood.", answer: "TRUE", explanation: "Two hearts pump blood to the gills; one pumps to the body. Copper-based haemocyanin makes blood blue.", difficulty: "easy", speedMax: 15 },
-  { statement: "The Eiffel Tower was originally built as a permanent structure for Paris.", answer: "TWIST", explanation: "It was built as a temporary exhibit for the 1889 World's Fair and was slated for demolition.", difficulty: "easy", speedMax: 15 },
-  { statement: "Bananas are technically berries, but strawberries are not.", answer: "TRUE", explanation: "Botanically, bananas develop from a single flower with one ovary. Strawberries are 'accessory fruits'.", difficulty: "easy", speedMax: 15 },
-  { statement: "Lightning never strikes the same place twice.", answer: "TWIST", explanation: "Lightning frequently strikes the same place multiple times — the Empire State Building is hit ~20–25 times per year.", difficulty: "easy", speedMax: 15 },
-  { statement: "Humans have five senses.", answer: "TWIST", explanation: "Humans have at least 9 senses including proprioception, thermoception, nociception, and the vestibular sense.", difficulty: "easy", speedMax: 15 },
-  { statement: "Goldfish have a memory span of only 3 seconds.", answer: "TWIST", explanation: "Studies show goldfish can remember things for months and can be trained to perform tasks.", difficulty: "easy", speedMax: 15 },
-  { statement: "Cleopatra lived closer in time to the Moon landing than to the construction of the Great Pyramid.", answer: "TRUE", explanation: "The pyramids were built ~2560 BC; Cleopatra lived ~30 BC; the Moon landing was 1969 AD.", difficulty: "easy", speedMax: 15 },
-  { statement: "A day on Venus is shorter than a year on Venus.", answer: "TWIST", explanation: "A Venus day (243 Earth days) is actually LONGER than its year (225 Earth days).", difficulty: "easy", speedMax: 15 },
-
-  // ── MEDIUM (less obvious, needs knowledge) ───────────────────────────────────
-  { statement: "Mount Everest is the tallest mountain on Earth measured from its base.", answer: "TWIST", explanation: "Mauna Kea is taller from base to peak (~10,210m), but most of it is underwater. Everest wins by sea-level height.", difficulty: "medium", speedMax: 20 },
-  { statement: "The human brain uses about 20% of the body's total energy.", answer: "TRUE", explanation: "The brain is only 2% of body weight but consumes ~20% of total caloric energy.", difficulty: "medium", speedMax: 20 },
-  { statement: "Lightning strikes the Earth about 100 times every second.", answer: "TRUE", explanation: "Earth experiences roughly 8 million lightning strikes per day — about 100 per second.", difficulty: "medium", speedMax: 20 },
-  { statement: "Water always boils at 100°C (212°F).", answer: "TWIST", explanation: "Boiling point varies with altitude and pressure. At the top of Everest, water boils at ~70°C.", difficulty: "medium", speedMax: 20 },
-  { statement: "Napoleon Bonaparte was unusually short for his era.", answer: "TWIST", explanation: "Napoleon was ~5'7\" (170cm) — average to tall for the time. The 'short Napoleon' myth stemmed from British propaganda.", difficulty: "medium", speedMax: 20 },
-  { statement: "Sharks are the only fish that cannot blink.", answer: "TWIST", explanation: "Most fish don't have eyelids. Some sharks do have a nictitating membrane — a protective third eyelid.", difficulty: "medium", speedMax: 20 },
-  { statement: "The Amazon River flows into the Atlantic Ocean.", answer: "TRUE", explanation: "The Amazon discharges into the Atlantic near Marajó Island in Brazil, pushing freshwater 160km into the ocean.", difficulty: "medium", speedMax: 20 },
-  { statement: "Oxford University is older than the Aztec Empire.", answer: "TRUE", explanation: "Oxford started teaching around 1096–1167. The Aztec Empire was founded in 1428.", difficulty: "medium", speedMax: 20 },
-  { statement: "Diamonds are the hardest natural substance on Earth.", answer: "TRUE", explanation: "Diamonds score 10 on the Mohs scale — the maximum. Nothing natural scratches a diamond.", difficulty: "medium", speedMax: 20 },
-  { statement: "The tongue has different zones for detecting different tastes.", answer: "TWIST", explanation: "The 'tongue map' is a myth. All taste buds can detect all five basic tastes across the entire tongue.", difficulty: "medium", speedMax: 20 },
-  { statement: "Sound travels faster through water than through air.", answer: "TRUE", explanation: "Sound travels ~1480 m/s in water vs ~343 m/s in air because water molecules are more tightly packed.", difficulty: "medium", speedMax: 20 },
-  { statement: "A group of flamingos is called a flamboyance.", answer: "TRUE", explanation: "Flamingo groups are officially called a flamboyance, pat, colony, or stand.", difficulty: "medium", speedMax: 20 },
-  { statement: "The Great Fire of London in 1666 killed thousands of people.", answer: "TWIST", explanation: "Remarkably, only 6 deaths were officially recorded in the Great Fire of London despite 13,000 homes destroyed.", difficulty: "medium", speedMax: 20 },
-  { statement: "Glass is a liquid that flows very slowly over time.", answer: "TWIST", explanation: "Glass is an amorphous solid. Old windows are thicker at the bottom due to manufacturing techniques, not flow.", difficulty: "medium", speedMax: 20 },
-  { statement: "Butterflies taste with their feet.", answer: "TRUE", explanation: "Butterflies have taste sensors on their tarsi (feet) to identify plants for egg-laying and food.", difficulty: "medium", speedMax: 20 },
-  { statement: "The human body contains about 37 trillion cells.", answer: "TRUE", explanation: "Current estimates put human cell count at 37 trillion, with red blood cells being the most numerous.", difficulty: "medium", speedMax: 20 },
-  { statement: "Walt Disney was the first voice of Mickey Mouse.", answer: "TRUE", explanation: "Walt Disney voiced Mickey Mouse from 1928 until 1947 when he handed the role to Jim Macdonald.", difficulty: "medium", speedMax: 20 },
-  { statement: "All planets in our solar system rotate in the same direction.", answer: "TWIST", explanation: "Venus rotates clockwise (retrograde), and Uranus rotates on its side. Most others rotate counterclockwise.", difficulty: "medium", speedMax: 20 },
-
-  // ── HARD (counterintuitive, niche knowledge) ─────────────────────────────────
-  { statement: "Cats can't taste sweetness.", answer: "TRUE", explanation: "Cats lack the Tas1r2 gene required to detect sweet flavours — they have no functional sweet taste receptor.", difficulty: "hard", speedMax: 25 },
-  { statement: "The word 'set' has the most definitions of any word in the English dictionary.", answer: "TRUE", explanation: "In the Oxford English Dictionary, 'set' has 430+ definitions — more than any other word.", difficulty: "hard", speedMax: 25 },
-  { statement: "The Sahara Desert has always been a desert.", answer: "TWIST", explanation: "Around 6,000–11,000 years ago the Sahara was green and had lakes, rivers, and hippos. This is called the 'Green Sahara'.", difficulty: "hard", speedMax: 25 },
-  { statement: "You cannot hum while holding your nose closed.", answer: "TRUE", explanation: "Humming requires air to escape through the nose. Pinch your nose and the hum stops.", difficulty: "hard", speedMax: 25 },
-  { statement: "The first computer bug was an actual bug.", answer: "TRUE", explanation: "In 1947, Grace Hopper's team found a moth in a Harvard Mark II relay — the first literal computer bug.", difficulty: "hard", speedMax: 25 },
-  { statement: "Hot water freezes faster than cold water.", answer: "TRUE", explanation: "This is the Mpemba effect. Under certain conditions hot water does freeze faster, though scientists still debate the mechanism.", difficulty: "hard", speedMax: 25 },
-  { statement: "Wombat droppings are cube-shaped.", answer: "TRUE", explanation: "Wombats produce cube-shaped scat due to the last 8% of their intestine stretching at different rates. Unique in the animal kingdom.", difficulty: "hard", speedMax: 25 },
-  { statement: "The shortest war in history lasted 38 minutes.", answer: "TRUE", explanation: "The Anglo-Zanzibar War of 1896 lasted between 38 and 45 minutes — the shortest war ever recorded.", difficulty: "hard", speedMax: 25 },
-  { statement: "Humans share about 50% of their DNA with bananas.", answer: "TRUE", explanation: "Approximately 50% of human genes are shared with bananas due to common cellular machinery inherited from a common ancestor.", difficulty: "hard", speedMax: 25 },
-  { statement: "Pluto is smaller than the United States.", answer: "TRUE", explanation: "Pluto's surface area (~17.6M km²) is smaller than Russia, and about 1.5× the size of the contiguous US.", difficulty: "hard", speedMax: 25 },
-  { statement: "A single strand of spaghetti is called a spaghetto.", answer: "TRUE", explanation: "Grammatically correct Italian singular of 'spaghetti' (plural) is 'spaghetto'. Same logic applies to panino/panini.", difficulty: "hard", speedMax: 25 },
-  { statement: "There are more possible chess games than atoms in the observable universe.", answer: "TRUE", explanation: "The Shannon number estimates 10^120 possible chess games vs ~10^80 atoms in the observable universe.", difficulty: "hard", speedMax: 25 },
-  { statement: "Humans are the only animals that cook their food.", answer: "TRUE", explanation: "No other animal deliberately applies heat to transform food. Cooking is considered a key driver of human brain evolution.", difficulty: "hard", speedMax: 25 },
-  { statement: "The inventor of the World Wide Web invented it in the USA.", answer: "TWIST", explanation: "Tim Berners-Lee invented the WWW in 1989 while working at CERN in Geneva, Switzerland.", difficulty: "hard", speedMax: 25 },
-  { statement: "Crows can recognise and remember human faces.", answer: "TRUE", explanation: "Studies show crows can recognise individual humans, hold grudges, and even warn other crows about 'dangerous' faces.", difficulty: "hard", speedMax: 25 },
-  { statement: "A day on Mercury is longer than a year on Mercury.", answer: "TRUE", explanation: "Mercury rotates so slowly that one solar day (176 Earth days) is longer than its orbital year (88 Earth days).", difficulty: "hard", speedMax: 25 },
-  { statement: "The average human walks about 100,000 miles in a lifetime.", answer: "TRUE", explanation: "Averaging ~7,500 steps/day over a lifetime, most people walk about 100,000 miles — equivalent to 4 trips around Earth.", difficulty: "hard", speedMax: 25 },
-  { statement: "There are more trees on Earth than stars in the Milky Way.", answer: "TRUE", explanation: "Earth has ~3 trillion trees; the Milky Way has an estimated 100–400 billion stars.", difficulty: "hard", speedMax: 25 },
-  { statement: "Helium was first discovered on Earth before it was discovered in space.", answer: "TWIST", explanation: "Helium was discovered in the sun's spectrum in 1868 (hence 'helios') before being found on Earth in 1895.", difficulty: "hard", speedMax: 25 },
-  { statement: "A teaspoon of a neutron star would weigh about 10 million tons.", answer: "TRUE", explanation: "Neutron stars have densities of ~4×10^17 kg/m³. A teaspoon (~5mL) would weigh roughly 10 million metric tons on Earth.", difficulty: "hard", speedMax: 25 },
-  { statement: "The letter 'E' appears in the US Declaration of Independence more than any other letter.", answer: "TRUE", explanation: "'E' is the most common letter in English. In the Declaration, 'e' appears over 1,300 times.", difficulty: "hard", speedMax: 25 },
-];
-
-// Per-room statement indices
-const roomStatements = {};
-
-function pickStatementsForRoom(roomId, difficulty = 'mixed') {
-  const n = ALL_STATEMENTS.length;
-  // For mixed: pick 2 easy, 2 medium, 1 hard (5 total)
-  // For specific difficulty: pick 5 from that tier
-  let pool;
-  if (difficulty === 'easy') {
-    pool = ALL_STATEMENTS.filter(s => s.difficulty === 'easy');
-  } else if (difficulty === 'medium') {
-    pool = ALL_STATEMENTS.filter(s => s.difficulty === 'medium');
-  } else if (difficulty === 'hard') {
-    pool = ALL_STATEMENTS.filter(s => s.difficulty === 'hard');
-  } else {
-    // mixed: 2 easy + 2 medium + 1 hard
-    const easy   = shuffle(ALL_STATEMENTS.filter(s => s.difficulty === 'easy')).slice(0, 2);
-    const medium = shuffle(ALL_STATEMENTS.filter(s => s.difficulty === 'medium')).slice(0, 2);
-    const hard   = shuffle(ALL_STATEMENTS.filter(s => s.difficulty === 'hard')).slice(0, 1);
-    pool = [...easy, ...medium, ...hard];
-    // shuffle the final 5 so order is random
-    return shuffle(pool).map(s => ALL_STATEMENTS.indexOf(s));
-  }
-  return shuffle(pool).slice(0, 5).map(s => ALL_STATEMENTS.indexOf(s));
-}
-
-function shuffle(arr) {
-  const a = [...arr];
-  for (let i = a.length - 1; i > 0; i--) {
-    const j = Math.floor(Math.random() * (i + 1));
-    [a[i], a[j]] = [a[j], a[i]];
-  }
-  return a;
-}
-
-function getStatementForRoom(roomId, round) {
-  const indices = roomStatements[roomId];
-  if (!indices) return null;
-  const idx = indices[(round - 1) % indices.length];
-  return ALL_STATEMENTS[idx] || null;
-}
-
 function sleep(ms) { return new Promise(r => setTimeout(r, ms)); }
 
 // ── CONNECT ───────────────────────────────────────────────────────────────────
@@ -261,8 +162,44 @@ async function writeContract(functionName, args = []) {
   }
 }
 
+// A write's return value, from the leader's receipt (JSON-decoded when it parses)
+function receiptResult(receipt) {
+  const leader = receipt?.consensus_data?.leader_receipt?.[0];
+  for (const raw of [leader?.result?.payload?.readable, leader?.genvm_result?.stdout]) {
+    if (typeof raw !== 'string' || !raw.trim()) continue;
+    try { return JSON.parse(raw.trim()); } catch(e) { return raw.trim(); }
+  }
+  return null;
+}
+
+// ── CONSENSUS MODES + WRITE TIMING ────────────────────────────────────────────
+// 'leader' goes out as a leader-only tx; the validated modes need full consensus.
+// Every timed write is tallied per mode so /api/consensus-stats shows the latency cost.
+const CONSENSUS_MODES = ['leader', 'non_comparative', 'comparative'];
+const writeStats = {}; // "<mode>:<function>" -> { mode, function, calls, failures, total_ms, max_ms }
+
+async function timedWrite(functionName, args = [], mode = 'leader') {
+  const key  = `${mode}:${functionName}`;
+  const stat = writeStats[key] || (writeStats[key] = { mode, function: functionName, calls: 0, failures: 0, total_ms: 0, max_ms: 0 });
+  const started = Date.now();
+  try {
+    return mode === 'leader'
+      ? await writeContractLeaderOnly(functionName, args)
+      : await writeContract(functionName, args);
+  } catch (err) {
+    stat.failures++;
+    throw err;
+  } finally {
+    const ms = Date.now() - started;
+    stat.calls++;
+    stat.total_ms += ms;
+    stat.max_ms = Math.max(stat.max_ms, ms);
+    console.log(`⏱️  ${functionName} [${mode}] took ${(ms / 1000).toFixed(1)}s`);
+  }
+}
+
 // ── HTTP ROUTES ───────────────────────────────────────────────────────────────
-app.get('/health', (req, res) => res.json({ status:'alive', contract: CONTRACT_ADDRESS, network:'studionet', questions: ALL_STATEMENTS.length }));
+app.get('/health', (req, res) => res.json({ status:'alive', contract: CONTRACT_ADDRESS, network:'studionet' }));
 
 app.get('/api/weekly-topic', async (req, res) => {
   try {
@@ -281,6 +218,12 @@ app.get('/api/leaderboard', async (req, res) => {
   res.json({ success: true, data: lb });
 });
 
+app.get('/api/consensus-stats', (req, res) => {
+  const data = Object.values(writeStats)
+    .map(s => ({ ...s, avg_ms: s.calls ? Math.round(s.total_ms / s.calls) : 0 }));
+  res.json({ success: true, data });
+});
+
 app.get('/api/room/:roomId', async (req, res) => {
   try {
     const data = await readContract('get_room_state', [req.params.roomId]);
@@ -297,6 +240,46 @@ app.get('/api/player-profile/:address', async (req, res) => {
   }
 });
 
+app.get('/api/player-by-nickname/:nickname', async (req, res) => {
+  try {
+    const data = await readContract('find_player_by_nickname', [req.params.nickname]);
+    res.json({ success: true, data });
+  } catch (err) { res.status(500).json({ success: false, error: err.message }); }
+});
+
+// Tail the contract's event log: ?since=<next_seq from the previous page>&limit=100
+app.get('/api/events', async (req, res) => {
+  try {
+    const data = await readContract('get_events_since', [Number(req.query.since) || 0, Number(req.query.limit) || 100]);
+    res.json({ success: true, data });
+  } catch (err) { res.status(500).json({ success: false, error: err.message }); }
+});
+
+// Replica bootstrap: /api/export/profiles|rooms|statements|rankings?cursor=<next_cursor>
+app.get('/api/export/:kind', async (req, res) => {
+  try {
+    const data = await readContract('export_state_page', [req.params.kind, String(req.query.cursor || ''), Number(req.query.limit) || 50]);
+    res.json({ success: true, data });
+  } catch (err) { res.status(500).json({ success: false, error: err.message }); }
+});
+
+// Many records in one RPC: ?ids=ROOM-0001,ROOM-0002 / ?addresses=0xA,0xB (max 50)
+app.get('/api/rooms', async (req, res) => {
+  try {
+    const ids = String(req.query.ids || '').split(',').filter(Boolean).slice(0, 50);
+    const data = await readContract('get_rooms_batch', [ids, String(req.query.viewer || '')]);
+    res.json({ success: true, data });
+  } catch (err) { res.status(500).json({ success: false, error: err.message }); }
+});
+
+app.get('/api/player-profiles', async (req, res) => {
+  try {
+    const addresses = String(req.query.addresses || '').split(',').filter(Boolean).slice(0, 50);
+    const data = await readContract('get_profiles_batch', [addresses]);
+    res.json({ success: true, data });
+  } catch (err) { res.status(500).json({ success: false, error: err.message }); }
+});
+
 app.get('/api/on-chain-leaderboard', async (req, res) => {
   try {
     const data = await readContract('get_leaderboard', []);
@@ -319,15 +302,17 @@ app.get('/api/weekly-questions', async (req, res) => {
   }
 });
 
-app.get('/api/statements', (req, res) => {
-  res.json({ 
-    total: ALL_STATEMENTS.length,
-    byDifficulty: {
-      easy:   ALL_STATEMENTS.filter(s=>s.difficulty==='easy').length,
-      medium: ALL_STATEMENTS.filter(s=>s.difficulty==='medium').length,
-      hard:   ALL_STATEMENTS.filter(s=>s.difficulty==='hard').length,
-    }
-  });
+app.get('/api/statements', async (req, res) => {
+  try {
+    const questions = (await readContract('get_weekly_questions', [])) || [];
+    const count = tier => questions.filter(q => q.difficulty === tier).length;
+    res.json({
+      total: questions.length,
+      byDifficulty: { easy: count('easy'), medium: count('medium'), hard: count('hard') },
+    });
+  } catch (err) {
+    res.json({ success: false, error: err.message });
+  }
 });
 
 // ── SOCKET.IO ─────────────────────────────────────────────────────────────────
@@ -358,6 +343,7 @@ io.on('connection', (socket) => {
   socket.on('create_room', async (data) => {
     try {
       const { playerAddress, difficulty = 'mixed' } = data;
+      const consensusMode = CONSENSUS_MODES.includes(data.consensusMode) ? data.consensusMode : 'leader';
       socket.emit('status_update', { message: '⛓️ Creating room...' });
 
       // Register player profile on-chain (creates profile + proves wallet activity)
@@ -368,7 +354,7 @@ io.on('connection', (socket) => {
         console.log('⚠️  register_player failed (non-critical):', e.message.slice(0,60));
       }
 
-      const receipt = await writeContractLeaderOnly('create_room', [playerAddress]);
+      const receipt = await writeContractLeaderOnly('create_room', [playerAddress, difficulty, 5, 8, consensusMode]);
 
       let roomId = null;
       try {
@@ -390,17 +376,14 @@ io.on('connection', (socket) => {
         nicknames:  { [playerAddress]: nickname },
         host:       socket.id,
         currentRound: 1,
+        totalRounds:  5,
         submissions:  {},
         scores:       {},
         difficulty,
+        consensusMode,
         gameActive: false,
       };
 
-      // Pick 5 random statements based on difficulty
-      const indices = pickStatementsForRoom(roomId, difficulty);
-      roomStatements[roomId] = indices;
-      console.log('📚 Room', roomId, `[${difficulty}]`, 'statements:', indices.map(i => ALL_STATEMENTS[i].statement.slice(0,30)));
-
       socket.join(roomId);
       socket.currentRoom = roomId;
       socket.playerAddress = playerAddress;
@@ -502,26 +485,31 @@ io.on('connection', (socket) => {
     try {
       const { roomId, hostAddress } = data;
       socket.emit('status_update', { message: '🚀 Starting game...' });
-      const receipt = await writeContractLeaderOnly('start_game', [roomId, hostAddress]);
+      const receipt = await writeContractLeaderOnly('start_game', [roomId, hostAddress, Math.floor(Date.now() / 1000)]);
 
       const receiptStr = JSON.stringify(receipt, null, 2);
       console.log('📋 start_game FULL receipt (first 4000 chars):');
       console.log(receiptStr.slice(0, 4000));
 
-      if (rooms[roomId]) rooms[roomId].gameActive = true;
-
-      const stmt1 = getStatementForRoom(roomId, 1);
-      const diff  = stmt1?.difficulty || 'medium';
-      console.log('📋 Serving statement for round 1:', stmt1?.statement?.slice(0, 60));
+      // start_game returns round 1's statement; the room state fills in what the receipt doesn't carry
+      const state = await readContract('get_room_state', [roomId]).catch(() => null);
+      const returned = receiptResult(receipt);
+      const statement = typeof returned === 'string' ? returned : state?.current_statement;
+      if (rooms[roomId]) {
+        rooms[roomId].gameActive  = true;
+        rooms[roomId].totalRounds = state?.total_rounds || rooms[roomId].totalRounds;
+      }
+      console.log('📋 Serving statement for round 1:', statement?.slice(0, 60));
 
       io.to(roomId).emit('game_started', { roomId });
       setTimeout(() => {
         io.to(roomId).emit('round_start', {
-          round: 1, total_rounds: 5,
-          statement: stmt1?.statement || 'Loading...',
-          difficulty: diff,
+          round: 1, total_rounds: rooms[roomId]?.totalRounds || 5,
+          statement: statement || 'Loading...',
+          difficulty: state?.current_difficulty || 'medium',
           time_limit: 15,
         });
+        scheduleRoundDeadline(roomId, 1);
       }, 2000);
 
     } catch (err) {
@@ -538,10 +526,18 @@ io.on('connection', (socket) => {
       // Spectators cannot submit
       if (socket.isSpectator) return;
 
+      // The round the player answered, fixed before any await: the contract rejects
+      // the answer if that round has closed in the meantime
+      const round = data.round || rooms[roomId]?.currentRound || 1;
       const submissionTime = Math.floor(Date.now() / 1000);
-      await writeContractLeaderOnly('submit_answer', [roomId, playerAddress, answer, explanation || '', submissionTime]);
+      await writeContractLeaderOnly('submit_answer', [roomId, round, playerAddress, answer, explanation || '', submissionTime]);
       socket.emit('answer_received', { success: true });
 
+      if (JUDGE_ON_SUBMIT) {
+        timedWrite('judge_submission', [roomId, round, playerAddress, ''], rooms[roomId]?.consensusMode || 'leader')
+          .catch(e => console.log('⚠️  judge_submission failed (judge_round will cover it):', e.message.slice(0, 60)));
+      }
+
       if (!rooms[roomId].submissions) rooms[roomId].submissions = {};
       rooms[roomId].submissions[playerAddress] = { answer, explanation: explanation || '', elapsedSeconds };
 
@@ -562,115 +558,171 @@ io.on('connection', (socket) => {
   });
 });
 
-// ── SCORING (server-side with speed bonus) ────────────────────────────────────
-async function triggerScoring(roomId) {
-  try {
-    io.to(roomId).emit('scoring_in_progress', { message: '⚡ Scoring your answers...' });
-
-    try { await writeContractLeaderOnly('score_round', [roomId]); } catch(e) {}
-
-    if (!rooms[roomId]) { console.error('Room gone:', roomId); return; }
-    const currentRound = rooms[roomId].currentRound || 1;
-    const stmt = getStatementForRoom(roomId, currentRound);
-    const correctAnswer = stmt?.answer || 'TRUE';
-    const correctExplanation = stmt?.explanation || '';
-    const speedMax = stmt?.speedMax || 15; // max speed bonus XP for this question
-
-    const submissions = rooms[roomId].submissions || {};
-    const roundResults = {};
-
-    for (const [addr, sub] of Object.entries(submissions)) {
-      const gotCorrect = sub.answer === correctAnswer;
-      const baseXp = gotCorrect ? 50 : 0;
-
-      // Speed bonus: faster = more XP (only awarded for correct answers)
-      // elapsedSeconds=0 → full speedMax bonus, elapsedSeconds=15 → 0 bonus
-      let speedBonus = 0;
-      if (gotCorrect) {
-        const elapsed = Math.min(15, sub.elapsedSeconds || 15);
-        speedBonus = Math.round(speedMax * (1 - elapsed / 15));
-      }
+// ── SCORING (on-chain: close_round, then judge_round) ─────────────────────────
+// XP, statements and the final ranking all come from the contract; the server only
+// decides when to close a round. A disconnected player can't stall the room: once
+// the deadline passes the round is closed with whoever answered.
+function scheduleRoundDeadline(roomId, round, delayMs = (ROUND_SECONDS + 2) * 1000) {
+  setTimeout(() => {
+    const room = rooms[roomId];
+    if (!room || !room.gameActive || room.currentRound !== round || room.scoredRound === round) return;
+    console.log(`⏰ Round ${round} deadline passed for ${roomId} — scoring without missing players`);
+    triggerScoring(roomId);
+  }, delayMs);
+}
 
-      const totalXp = baseXp + speedBonus;
-      if (!rooms[roomId].scores) rooms[roomId].scores = {};
-      rooms[roomId].scores[addr] = (rooms[roomId].scores[addr] || 0) + totalXp;
-
-      roundResults[addr] = {
-        correct: gotCorrect,
-        answer: sub.answer,
-        round_xp: totalXp,
-        base_xp: baseXp,
-        speed_bonus: speedBonus,
-        elapsed_seconds: sub.elapsedSeconds || 15,
-      };
-    }
+async function closeRound(roomId, round) {
+  const receipt = await writeContractLeaderOnly('close_round', [roomId, Math.floor(Date.now() / 1000)]);
+  const result  = receiptResult(receipt);
+  if (result && typeof result === 'object') return result;
+
+  // No return value on the receipt: the room state says whether the round moved on
+  const state = await readContract('get_room_state', [roomId]);
+  if (state.status === 'active' && state.current_round === round) return { waiting: true, deadline: 0 };
+  if (state.status !== 'active') return { closed_round: round, last_round: true };
+  return {
+    closed_round: round, last_round: false, next_round: state.current_round,
+    next_statement: state.current_statement, next_difficulty: state.current_difficulty,
+  };
+}
 
-    const scores = rooms[roomId].scores || {};
-    console.log(`📊 Round ${currentRound} scores:`, scores);
+async function judgeRound(roomId, round) {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      const receipt = await timedWrite('judge_round', [roomId, round, ''], rooms[roomId]?.consensusMode || 'leader');
+      const result  = receiptResult(receipt);
+      if (result?.round_complete) return result;
+      break;
+    } catch (err) {
+      console.log(`⚠️  judge_round ${round} attempt ${attempt} failed:`, err.message.slice(0, 80));
+      if (attempt >= JUDGE_ATTEMPTS) throw err;
+      await sleep(5000 * attempt);
+    }
+  }
 
-    const roundResult = {
-      correct_answer: correctAnswer,
-      real_explanation: correctExplanation,
-      round_results: roundResults,
-      difficulty: stmt?.difficulty || 'medium',
-    };
+  const [stored, state] = await Promise.all([
+    readContract('get_round_results', [roomId, round]),
+    readContract('get_room_state', [roomId]),
+  ]);
+  return { ...stored, current_scores: state.scores, game_over: state.status === 'finished' };
+}
 
-    const nextRound = currentRound + 1;
-    rooms[roomId].submissions = {};
-    rooms[roomId].currentRound = nextRound;
-    const isLastRound = currentRound >= 5;
+function emitRoundResults(roomId, result) {
+  const room = rooms[roomId];
+  if (!room) return;
+  room.scores = result.current_scores || room.scores;
+  console.log(`📊 Round ${result.round_number} scored on-chain for ${roomId}:`, JSON.stringify(room.scores));
+  io.to(roomId).emit('round_results', {
+    roundResult: {
+      round_number:     result.round_number,
+      correct_answer:   result.correct_answer,
+      real_explanation: result.real_explanation,
+      difficulty:       result.difficulty,
+      round_results:    result.round_results || {},
+    },
+    roomState: {
+      scores: room.scores, nicknames: room.nicknames,
+      current_round: room.currentRound, status: room.gameActive ? 'active' : 'finished',
+    },
+  });
+}
 
-    console.log('📊 Emitting round_results. scores:', JSON.stringify(scores));
-    const nicknames = rooms[roomId]?.nicknames || {};
-    io.to(roomId).emit('round_results', {
-      roundResult,
-      roomState: { scores, nicknames, current_round: nextRound, status: isLastRound ? 'finished' : 'active' }
-    });
+async function triggerScoring(roomId) {
+  const room = rooms[roomId];
+  const round = room?.currentRound || 1;
+  if (!room || room.scoredRound === round) return; // all-submitted and deadline can both fire
+  room.scoredRound = round;
+  try {
+    // Closing is a quick write with no AI and opens the next round; judging runs
+    // alongside it and lands on-chain whenever it finishes
+    const closed = await closeRound(roomId, round);
+    if (closed.waiting) {
+      // Someone is still answering and the contract's deadline hasn't passed: try again once it has
+      room.scoredRound = null;
+      const wait = closed.deadline ? closed.deadline * 1000 - Date.now() : ROUND_SECONDS * 1000;
+      console.log(`⏳ Round ${round} of ${roomId} still open (${closed.submitted ?? '?'}/${closed.total ?? '?'} answered)`);
+      scheduleRoundDeadline(roomId, round, Math.max(wait, 0) + 2000);
+      return;
+    }
+    if (closed.closed_round !== round) throw new Error(`close_round closed round ${closed.closed_round}, expected ${round}`);
 
-    if (isLastRound) {
-      rooms[roomId].gameActive = false;
-      const finalScores = rooms[roomId].scores || {};
-      const ranking = Object.entries(finalScores)
-        .sort((a,b) => b[1]-a[1])
-        .map(([player, score], i) => ({ rank: i+1, player, score }));
-      console.log('🏆 Game over! Ranking:', ranking);
-      const gameNicknames = rooms[roomId]?.nicknames || {};
-      updateLeaderboard(ranking, gameNicknames);
-
-      // Update on-chain player profiles (async, non-blocking)
-      Promise.allSettled(ranking.map(async (entry) => {
-        try {
-          await writeContractLeaderOnly('update_player_stats', [
-            entry.player,
-            entry.score,
-            entry.rank === 1,
-            entry.score,
-          ]);
-          console.log(`👤 On-chain profile updated: ${entry.player.slice(0,10)} +${entry.score}XP`);
-        } catch(e) {
-          console.log('⚠️  update_player_stats failed (non-critical):', e.message.slice(0,60));
-        }
-      })).then(() => console.log('✅ All on-chain profiles updated'));
+    room.judging = room.judging || {};
+    room.judging[round] = judgeRound(roomId, round).then(
+      result => { emitRoundResults(roomId, result); return result; },
+      err => { console.log(`⚠️  judge_round ${round} gave up:`, err.message.slice(0, 80)); return null; },
+    );
 
-      io.to(roomId).emit('game_over', { final_ranking: ranking, nicknames: gameNicknames });
-    } else {
-      setTimeout(() => {
-        const nextStmt = getStatementForRoom(roomId, nextRound);
-        console.log('📋 Round', nextRound, 'statement:', nextStmt?.statement?.slice(0, 50));
-        io.to(roomId).emit('round_start', {
-          round: nextRound, total_rounds: 5,
-          statement: nextStmt?.statement || 'Loading...',
-          difficulty: nextStmt?.difficulty || 'medium',
-          time_limit: 15,
-        });
-      }, 6000);
+    if (closed.last_round) {
+      await finishGame(roomId);
+      return;
     }
+
+    room.submissions  = {};
+    room.currentRound = closed.next_round;
+    console.log('📋 Round', closed.next_round, 'statement:', closed.next_statement?.slice(0, 50));
+    io.to(roomId).emit('round_start', {
+      round: closed.next_round, total_rounds: room.totalRounds,
+      statement: closed.next_statement || 'Loading...',
+      difficulty: closed.next_difficulty || 'medium',
+      time_limit: 15,
+    });
+    scheduleRoundDeadline(roomId, closed.next_round);
   } catch (err) {
     console.error('Scoring failed:', err.message);
+    if (room.gameActive && room.scoredRound === round) {
+      // The close didn't go through: let the next deadline check try again
+      room.scoredRound = null;
+      scheduleRoundDeadline(roomId, round, 5000);
+    }
     io.to(roomId).emit('error', { message: 'Scoring error: ' + err.message.slice(0,80) });
   }
 }
 
+// The contract finalizes the game when its last round is judged; the leaderboard
+// and on-chain profiles are fed from that final ranking. A round whose judge_round
+// gave up (or never ran, e.g. across a server restart) is judged again here first.
+async function finishGame(roomId) {
+  const room = rooms[roomId];
+  room.gameActive = false;
+  io.to(roomId).emit('scoring_in_progress', { message: '⚡ Scoring the last round...' });
+  await Promise.all(Object.values(room.judging || {}));
+
+  let state = await readContract('get_room_state', [roomId]);
+  for (let round = 1; state.status === 'judging' && round <= state.total_rounds; round++) {
+    const judged = await readContract('get_round_results', [roomId, round]).then(() => true, () => false);
+    if (judged) continue;
+    console.log(`🔁 Re-judging round ${round} of ${roomId} before the game ends`);
+    const result = await judgeRound(roomId, round).catch(err => {
+      console.log(`⚠️  judge_round ${round} failed again:`, err.message.slice(0, 80));
+      return null;
+    });
+    if (result) emitRoundResults(roomId, result);
+    state = await readContract('get_room_state', [roomId]);
+  }
+  if (state.status !== 'finished') throw new Error(`${roomId} is still ${state.status}: not every round could be judged`);
+  const ranking = state.final_ranking || [];
+  console.log('🏆 Game over! Ranking:', ranking);
+  const gameNicknames = rooms[roomId]?.nicknames || {};
+  updateLeaderboard(ranking, gameNicknames);
+
+  // Update on-chain player profiles (async, non-blocking)
+  Promise.allSettled(ranking.map(async (entry) => {
+    try {
+      await writeContractLeaderOnly('update_player_stats', [
+        entry.player,
+        entry.score,
+        entry.rank === 1,
+        entry.score,
+      ]);
+      console.log(`👤 On-chain profile updated: ${entry.player.slice(0,10)} +${entry.score}XP`);
+    } catch(e) {
+      console.log('⚠️  update_player_stats failed (non-critical):', e.message.slice(0,60));
+    }
+  })).then(() => console.log('✅ All on-chain profiles updated'));
+
+  io.to(roomId).emit('game_over', { final_ranking: ranking, nicknames: gameNicknames });
+}
+
 // ── START ─────────────────────────────────────────────────────────────────────
 async function main() {
   const ok = await initializeClient();
@@ -678,13 +730,24 @@ async function main() {
   httpServer.listen(PORT, async () => {
     console.log('\n✅ Server running! http://localhost:' + PORT + '/health\n');
     console.log('📌 Contract:', CONTRACT_ADDRESS);
-    console.log('📚 Questions loaded:', ALL_STATEMENTS.length, '(Easy:', ALL_STATEMENTS.filter(s=>s.difficulty==='easy').length, '| Medium:', ALL_STATEMENTS.filter(s=>s.difficulty==='medium').length, '| Hard:', ALL_STATEMENTS.filter(s=>s.difficulty==='hard').length + ')');
     console.log('💡 Keep studio.genlayer.com open in a browser tab!\n');
 
+    // A week that already has rooms keeps its statements (the contract refuses to regenerate it)
+    try {
+      const week = await readContract('get_weekly_topic', []);
+      if (week.statements_locked) {
+        console.log(`📚 Week ${week.week_number} already has rooms — keeping its ${week.statements_source} statements 🎮`);
+        USE_AI_QUESTIONS = week.statements_source === 'ai';
+        return;
+      }
+    } catch (e) {
+      console.log('⚠️  get_weekly_topic failed, generating anyway:', e.message.slice(0, 60));
+    }
+
     // Try AI question generation first, fall back to hardcoded if it fails
-    console.log('🤖 Generating AI weekly questions (leader only, ~60s)...');
+    console.log(`🤖 Generating AI weekly questions (${AI_QUESTIONS_MODE}, ~60s)...`);
     try {
-      const aiResult = await writeContractLeaderOnly('generate_ai_questions', []);
+      const aiResult = await timedWrite('generate_ai_questions', [AI_QUESTIONS_MODE], AI_QUESTIONS_MODE);
       // Parse result from receipt stdout
       let aiData = null;
       try {
@@ -698,13 +761,13 @@ async function main() {
         throw new Error('AI returned 0 questions');
       }
     } catch(e) {
-      console.log('⚠️  AI generation failed, using server-side questions:', e.message.slice(0,80));
+      console.log('⚠️  AI generation failed, using the built-in statements:', e.message.slice(0,80));
       console.log('📚 Calling fallback generate_statements...');
       try {
         await writeContractLeaderOnly('generate_statements', []);
         console.log('✅ Fallback questions ready! 🎮');
       } catch(e2) {
-        console.log('⚠️  Both generation methods failed. Gameplay will use server-side questions only.');
+        console.log('⚠️  Both generation methods failed. Rooms will use the contract\'s built-in statements.');
       }
     }
   });
@@ -0,0 +1,60 @@
+"""
+Stored size and decode time: the compact record codec vs the JSON it replaced.
+
+Compares a room_final_ranking (JSON list of {"rank","player","score"} dicts
+vs encode_ranking) and one scored round (v2's score_round JSON with
+xp_breakdown strings vs an encode_round_results record).
+
+    python bench/codec.py
+"""
+
+import json
+import timeit
+
+from common import load_contract, players
+
+m = load_contract("v3")
+
+
+def ranking_case(n: int):
+    entries = [(addr, 1000 - i * 7) for i, addr in enumerate(players(n))]
+    as_json = json.dumps([{"rank": i + 1, "player": a, "score": s} for i, (a, s) in enumerate(entries)])
+    return as_json, m.encode_ranking(entries), m.decode_ranking
+
+
+def round_case(n: int):
+    results, rows = {}, []
+    for i, addr in enumerate(players(n)):
+        correct, ai_score = i % 2 == 0, (i * 37) % 101
+        fastest, perfect  = i == 0, i == 2
+        xp = m.base_xp(correct, ai_score) + (m.XP_FASTEST if fastest else 0) + (m.XP_PERFECT if perfect else 0)
+        breakdown = (["+10 correct"] if correct else []) + [f"+{ai_score // 5} explanation"]
+        breakdown += (["+5 fastest!"] if fastest else []) + (["+10 perfect round!"] if perfect else [])
+        feedback = "Clear reasoning that cites the key fact."
+        results[addr] = {
+            "answer": "TRUE" if correct else "TWIST", "correct": correct, "ai_score": ai_score,
+            "ai_feedback": feedback, "round_xp": xp, "xp_breakdown": breakdown,
+            "speed_bonus": fastest, "perfect_round": perfect,
+        }
+        flags = (m.FLAG_FASTEST if fastest else 0) | (m.FLAG_PERFECT if perfect else 0)
+        rows.append(m.encode_round_row(addr, results[addr]["answer"], correct, ai_score, xp, flags, feedback))
+    as_json = json.dumps({"round_complete": True, "round_results": results})
+    return as_json, m.encode_round_results(rows), m.decode_round_results
+
+
+def decode_us(fn, value: str) -> float:
+    runs = 2000
+    return timeit.timeit(lambda: fn(value), number=runs) * 1e6 / runs
+
+
+print(f"{'record':<22} | {'json B':>7} {'codec B':>7} {'ratio':>5} | {'json us':>7} {'codec us':>8}")
+for label, (as_json, encoded, decode) in [
+    ("ranking, 8 players",   ranking_case(8)),
+    ("ranking, 100 players", ranking_case(100)),
+    ("round, 8 players",     round_case(8)),
+    ("round, 32 players",    round_case(32)),
+]:
+    print(
+        f"{label:<22} | {len(as_json):>7} {len(encoded):>7} {len(encoded) / len(as_json):>5.2f}"
+        f" | {decode_us(json.loads, as_json):>7.1f} {decode_us(decode, encoded):>8.1f}"
+    )
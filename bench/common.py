@@ -0,0 +1,52 @@
+"""Shared setup for the bench scripts: load a contract on the stub SDK, fake the AI judge."""
+
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR  = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from genlayer import gl, count_reads  # noqa: E402  (the stub in this folder)
+
+
+def fake_judge(prompt: str) -> str:
+    """Score every "PlayerID: <id>" in a judging prompt, deterministically."""
+    ids = re.findall(r"PlayerID: (\S+)", prompt)
+    scores = {pid: {"score": sum(map(ord, pid)) * 37 % 101, "feedback": "ok"} for pid in ids}
+    return json.dumps({"scores": scores})
+
+
+gl.prompt_handler = fake_judge
+
+
+def load_contract(version: str, rev: str = ""):
+    """
+    Import truth_or_twist_<version>.py from the working tree, or as it was at
+    git revision `rev` (e.g. to count reads before and after a change).
+    """
+    filename = f"truth_or_twist_{version}.py"
+    path = os.path.join(REPO_DIR, filename)
+    if rev:
+        source = subprocess.run(
+            ["git", "show", f"{rev}:{filename}"], cwd=REPO_DIR, check=True, capture_output=True, text=True,
+        ).stdout
+        path = os.path.join(tempfile.mkdtemp(), filename)
+        with open(path, "w") as f:
+            f.write(source)
+    spec   = importlib.util.spec_from_file_location(f"{version}_{rev or 'tree'}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def players(n: int) -> list:
+    return [f"0x{i:040x}" for i in range(n)]
+
+
+__all__ = ["BENCH_DIR", "REPO_DIR", "count_reads", "fake_judge", "load_contract", "players"]
@@ -0,0 +1,108 @@
+"""
+Minimal stand-in for the GenLayer SDK so the contracts can be imported and
+driven off-chain by the scripts in this folder. It is NOT the real SDK and
+is never deployed:
+
+- TreeMap is a dict. Every read (get / [] / in) is counted in READS, so
+  benchmarks can report storage reads per call.
+- Storage fields declared on a gl.Contract start out empty.
+- gl.exec_prompt calls gl.prompt_handler, which a script sets to a fake
+  judge. The equivalence principles and run_nondet just run the leader
+  function, and run_nondet also checks it with the validator.
+"""
+
+READS = [0]
+
+
+class TreeMap(dict):
+    def __class_getitem__(cls, item):
+        return cls
+
+    def get(self, key, default=None):
+        READS[0] += 1
+        return dict.get(self, key, default)
+
+    def __getitem__(self, key):
+        READS[0] += 1
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        READS[0] += 1
+        return dict.__contains__(self, key)
+
+
+class DynArray(list):
+    def __class_getitem__(cls, item):
+        return cls
+
+
+class _Public:
+    @staticmethod
+    def write(fn):
+        return fn
+
+    @staticmethod
+    def view(fn):
+        return fn
+
+
+class _Return:
+    def __init__(self, calldata):
+        self.calldata = calldata
+
+
+class _VM:
+    Return = _Return
+
+    @staticmethod
+    def run_nondet(leader_fn, validator_fn):
+        result = leader_fn()
+        if not validator_fn(_Return(result)):
+            raise Exception("validator rejected the leader result")
+        return result
+
+
+class _Contract:
+    def __init_subclass__(cls, **kwargs):
+        init = cls.__init__
+
+        def __init__(self, *args, **kw):
+            for name, kind in cls.__annotations__.items():
+                if kind is TreeMap:
+                    setattr(self, name, TreeMap())
+                elif kind is DynArray:
+                    setattr(self, name, DynArray())
+            init(self, *args, **kw)
+
+        cls.__init__ = __init__
+
+
+class _GL:
+    public         = _Public()
+    vm             = _VM()
+    Contract       = _Contract
+    prompt_handler = None
+
+    def exec_prompt(self, prompt):
+        return self.prompt_handler(prompt)
+
+    def eq_principle_prompt_non_comparative(self, fn, task="", criteria=""):
+        return fn()
+
+    def eq_principle_prompt_comparative(self, fn, principle=""):
+        return fn()
+
+    def eq_principle_strict_eq(self, fn):
+        return fn()
+
+
+gl = _GL()
+
+__all__ = ["gl", "TreeMap", "DynArray"]
+
+
+def count_reads(fn):
+    """Run fn() and return (result, storage reads it made)."""
+    start = READS[0]
+    result = fn()
+    return result, READS[0] - start
@@ -0,0 +1,37 @@
+"""
+Storage reads per call as rooms get bigger and longer (v3).
+
+For each room size and round count this plays a full game and reports the
+reads made by join_room (last seat), submit_answer (last answer of a round),
+get_room_state and score_round. The first three should stay flat. score_round
+has to read each submission, so its reads per player should stay flat too.
+
+    python bench/room_scaling.py
+"""
+
+from common import count_reads, load_contract, players
+
+m = load_contract("v3")
+
+print(f"{'players':>7} {'rounds':>6} | {'join':>4} {'submit':>6} {'state':>5} | {'score/round':>11} {'score/player':>12}")
+for size in (2, 8, 16, 32):
+    for rounds in (5, 10, 20):
+        c = m.TruthOrTwist()
+        c.generate_statements()
+        ps   = players(size)
+        room = c.create_room(ps[0], "mixed", rounds, size)
+        join = 0
+        for p in ps[1:]:
+            _, join = count_reads(lambda: c.join_room(room, p))
+        c.start_game(room, ps[0])
+
+        submit = state = score = 0
+        for rnd in range(rounds):
+            for i, p in enumerate(ps):
+                _, submit = count_reads(lambda: c.submit_answer(room, rnd + 1, p, "TRUE" if i % 2 else "TWIST", "because", i))
+            _, state  = count_reads(lambda: c.get_room_state(room))
+            _, reads  = count_reads(lambda: c.score_round(room))
+            score += reads
+
+        per_round = score / rounds
+        print(f"{size:>7} {rounds:>6} | {join:>4} {submit:>6} {state:>5} | {per_round:>11.1f} {per_round / size:>12.2f}")
@@ -0,0 +1,44 @@
+"""
+Storage reads made by score_round, before and after submissions were stored
+as one encoded row each (commit 13daec4), and in the working tree.
+
+Before that change score_round fetched every player's answer, explanation
+and time from three separate maps; after it, one row per submission. The
+tree column is higher for v3 because later changes split scoring into
+close_round + judge_round and check each player for a score already stored
+by judge_submission (one more read per player).
+
+    python bench/score_reads.py [before-rev] [after-rev]
+"""
+
+import inspect
+import sys
+
+from common import count_reads, load_contract, players
+
+BEFORE = sys.argv[1] if len(sys.argv) > 1 else "13daec4^"
+AFTER  = sys.argv[2] if len(sys.argv) > 2 else "13daec4"
+
+
+def score_reads(m, version: str, size: int) -> int:
+    c = m.TruthOrTwist()
+    c.generate_statements()
+    ps   = players(size)
+    room = c.create_room(ps[0]) if version == "v2" else c.create_room(ps[0], "mixed", 5, size)
+    for p in ps[1:]:
+        c.join_room(room, p)
+    c.start_game(room, ps[0])
+    # The working tree's v3 also takes the round being answered
+    round_arg = ("1",) if "round_number" in inspect.signature(c.submit_answer).parameters else ()
+    for i, p in enumerate(ps):
+        c.submit_answer(room, *round_arg, p, "TRUE" if i % 2 else "TWIST", "Because the record says otherwise.", i)
+    _, reads = count_reads(lambda: c.score_round(room))
+    return reads
+
+
+print(f"{'contract':<8} {'players':>7} | {BEFORE:>10} {AFTER:>10} {'tree':>6}")
+for version in ("v2", "v3"):
+    builds = [load_contract(version, BEFORE), load_contract(version, AFTER), load_contract(version)]
+    for size in (2, 4, 8):
+        before, after, tree = (score_reads(m, version, size) for m in builds)
+        print(f"{version:<8} {size:>7} | {before:>10} {after:>10} {tree:>6}")
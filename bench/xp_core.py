@@ -0,0 +1,66 @@
+"""
+score_round_xp (v3's pure XP core) checked against a straight reference
+implementation of the rules over thousands of synthetic rounds, then timed.
+
+The rules: +10 for the right verdict, +ai_score // 5 for the explanation,
++5 for the fastest right answer (ties go to the earlier submission) and +10
+for the best explanation when its verdict is also right.
+
+    python bench/xp_core.py [rounds]
+"""
+
+import random
+import sys
+import time
+
+from common import load_contract
+
+m = load_contract("v3")
+
+ANSWERS = ("TRUE", "TWIST")
+
+
+def reference(answers, times, ai_scores, correct_answer):
+    n     = len(answers)
+    order = sorted(range(n), key=lambda i: (times[i], i))
+    fast  = next((i for i in order if answers[i] == correct_answer), None)
+    best  = max(range(n), key=lambda i: (ai_scores[i], -i)) if n else None
+    out   = []
+    for i in range(n):
+        correct = answers[i] == correct_answer
+        xp, flags = (m.XP_CORRECT if correct else 0) + ai_scores[i] // 5, 0
+        if i == fast:
+            xp, flags = xp + m.XP_FASTEST, flags | m.FLAG_FASTEST
+        if i == best and correct:
+            xp, flags = xp + m.XP_PERFECT, flags | m.FLAG_PERFECT
+        out.append((xp, flags))
+    return out
+
+
+def synthetic_rounds(count: int, seed: int = 1) -> list:
+    rng, rounds = random.Random(seed), []
+    for _ in range(count):
+        n = rng.randint(0, 32)
+        rounds.append((
+            [rng.choice(ANSWERS) for _ in range(n)],
+            [rng.randint(0, m.ROUND_SECONDS) for _ in range(n)],
+            [rng.randint(0, 100) for _ in range(n)],
+            rng.choice(ANSWERS),
+        ))
+    return rounds
+
+
+count  = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+rounds = synthetic_rounds(count)
+for r in rounds:
+    got, want = m.score_round_xp(*r), reference(*r)
+    if got != want:
+        sys.exit(f"mismatch on {r}: got {got}, want {want}")
+
+start = time.perf_counter()
+for r in rounds:
+    m.score_round_xp(*r)
+elapsed = time.perf_counter() - start
+players = sum(len(r[0]) for r in rounds)
+print(f"{count} rounds ({players} answers) match the reference")
+print(f"score_round_xp: {elapsed * 1e6 / count:.1f} us/round, {elapsed * 1e9 / max(players, 1):.0f} ns/answer")
@@ -5,6 +5,102 @@ from genlayer import *
 from dataclasses import dataclass
 import json
 
+# -- COMPACT RECORD CODEC ------------------------------
+# Versioned fixed-field encodings for stored rankings and round results.
+# The same block lives in every contract version - keep the copies identical.
+#   ranking:       "K1;addr:score,addr:score,..."          (rank = position)
+#   round results: "R1" RS row RS row ...                    (RS = \x1e)
+#   row:           addr US answer US correct US ai_score US xp US flags US feedback   (US = \x1f)
+#   submission:    addr US answer US time US explanation
+RANKING_CODEC = "K1;"
+ROUND_CODEC   = "R1"
+RECORD_SEP    = "\x1e"
+FIELD_SEP     = "\x1f"
+FLAG_FASTEST  = 1
+FLAG_PERFECT  = 2
+
+
+def encode_ranking(entries: list) -> str:
+    return RANKING_CODEC + ",".join(f"{addr}:{score}" for addr, score in entries)
+
+
+def decode_ranking(value: str) -> list:
+    """[(addr, score), ...] in rank order. Also reads legacy JSON and unversioned rankings."""
+    if not value:
+        return []
+    if value.startswith("["):
+        return [(e["player"], int(e["score"])) for e in json.loads(value)]
+    if value.startswith(RANKING_CODEC):
+        value = value[len(RANKING_CODEC):]
+    entries = []
+    for item in value.split(","):
+        if item:
+            addr, _, score = item.partition(":")
+            entries.append((addr, int(score or "0")))
+    return entries
+
+
+def encode_round_row(address: str, answer: str, correct: bool, ai_score: int, xp: int, flags: int, feedback: str) -> str:
+    feedback = feedback.replace(RECORD_SEP, " ").replace(FIELD_SEP, " ")
+    return FIELD_SEP.join((address, answer, "1" if correct else "0", str(ai_score), str(xp), str(flags), feedback))
+
+
+def decode_round_row(row: str) -> dict:
+    address, answer, correct, ai_score, xp, flags, feedback = row.split(FIELD_SEP)
+    return {
+        "player":        address,
+        "answer":        answer,
+        "correct":       correct == "1",
+        "ai_score":      int(ai_score),
+        "ai_feedback":   feedback,
+        "round_xp":      int(xp),
+        "speed_bonus":   bool(int(flags) & FLAG_FASTEST),
+        "perfect_round": bool(int(flags) & FLAG_PERFECT),
+    }
+
+
+def encode_submission(address: str, answer: str, time: int, explanation: str) -> str:
+    explanation = explanation.replace(RECORD_SEP, " ").replace(FIELD_SEP, " ")
+    return FIELD_SEP.join((address, answer, str(time), explanation))
+
+
+def decode_submission(row: str) -> tuple:
+    """(addr, answer, time, explanation)"""
+    address, answer, time, explanation = row.split(FIELD_SEP)
+    return address, answer, int(time), explanation
+
+
+def encode_round_results(rows: list) -> str:
+    """Pack rows built with encode_round_row into one versioned record."""
+    return RECORD_SEP.join([ROUND_CODEC] + rows)
+
+
+def decode_round_results(value: str) -> list:
+    if not value:
+        return []
+    parts = value.split(RECORD_SEP)
+    if parts[0] != ROUND_CODEC:
+        raise Exception(f"Unknown round results encoding: {parts[0]}")
+    return [decode_round_row(row) for row in parts[1:]]
+
+
+# Pre-written statements - no AI timeout risk.
+# AI is still used for scoring player EXPLANATIONS (the fun part).
+# (statement, answer, explanation); read in place, never copied into storage.
+STATEMENTS = (
+    ("The Great Wall of China is not visible from space with the naked eye.", "TRUE", "Despite the myth, the wall is too narrow to see from orbit without aid."),
+    ("Honey never expires — archaeologists found 3000-year-old honey in Egyptian tombs that was still edible.", "TRUE", "Honey's low moisture and acidic pH make it last indefinitely if sealed."),
+    ("A day on Venus is shorter than a year on Venus.", "TWIST", "A day on Venus (243 Earth days) is actually LONGER than its year (225 Earth days)."),
+    ("Octopuses have three hearts and blue blood.", "TRUE", "Two hearts pump blood to the gills; one pumps to the body. Copper-based blood is blue."),
+    ("The Eiffel Tower was originally built as a permanent structure for Paris.", "TWIST", "It was built as a temporary exhibit for the 1889 World's Fair and was meant to be demolished."),
+    ("Bananas are technically berries, but strawberries are not.", "TRUE", "Botanically, bananas qualify as berries; strawberries are accessory fruits."),
+    ("Mount Everest is the tallest mountain on Earth measured from sea level.", "TRUE", "At 8,849m above sea level, Everest is the highest point on Earth."),
+    ("The human brain uses about 80% of the body's total energy.", "TWIST", "The brain uses roughly 20% of the body's energy, not 80%."),
+    ("Lightning strikes the Earth about 100 times every second.", "TRUE", "Earth experiences roughly 8 million lightning strikes per day — about 100 per second."),
+    ("Cleopatra lived closer in time to the Moon landing than to the construction of the Great Pyramid.", "TRUE", "The pyramids were built ~2560 BC; Cleopatra lived ~30 BC; the Moon landing was 1969 AD."),
+)
+
+
 class TruthOrTwist(gl.Contract):
 
     room_host: TreeMap[str, str]
@@ -19,21 +115,19 @@ class TruthOrTwist(gl.Contract):
 
     submission_answers: TreeMap[str, str]
 
-    submission_explanations: TreeMap[str, str]
-
-    submission_times: TreeMap[str, str]
-
     round_submitted: TreeMap[str, str]
 
-    room_final_ranking: TreeMap[str, str]
+    # "room_id:round" -> encode_submission rows joined by RECORD_SEP, read once by score_round
+    round_submissions: TreeMap[str, str]
 
-    room_statement_indices: TreeMap[str, str]
+    room_final_ranking: TreeMap[str, str]
 
-    weekly_stmt_text: TreeMap[str, str]
+    room_ranking: TreeMap[str, str]
 
-    weekly_stmt_answer: TreeMap[str, str]
+    # "room_id:round" -> encode_round_results(...), written when the round is scored
+    round_results: TreeMap[str, str]
 
-    weekly_stmt_explanation: TreeMap[str, str]
+    room_statement_indices: TreeMap[str, str]
 
     weekly_stmt_count: str
 
@@ -62,46 +156,59 @@ class TruthOrTwist(gl.Contract):
             return []
         return value.split(",")
 
+    def _place_ranked(self, entries: list, address: str, score: int) -> None:
+        # Slide one player to its new place without re-sorting; ties keep the earlier entry first
+        for i, (addr, _) in enumerate(entries):
+            if addr == address:
+                entries.pop(i)
+                break
+        pos = len(entries)
+        for i, (_, other) in enumerate(entries):
+            if other < score:
+                pos = i
+                break
+        entries.insert(pos, (address, score))
+
+    def _apply_xp(self, room_id: str, deltas: dict) -> list:
+        # Update scores and the running ranking in one pass; returns the ranking
+        entries = decode_ranking(self.room_ranking.get(room_id, ""))
+        for addr, xp in deltas.items():
+            if xp == 0:
+                continue
+            score_key = f"{room_id}:{addr}"
+            total = int(self.player_scores.get(score_key, "0")) + xp
+            self.player_scores[score_key] = str(total)
+            self._place_ranked(entries, addr, total)
+        self.room_ranking[room_id] = encode_ranking(entries)
+        return entries
+
+    def _xp_breakdown(self, result: dict) -> list:
+        # Rebuild score_round's "xp_breakdown" from a stored round row
+        parts = []
+        if result["correct"]:
+            parts.append("+10 correct")
+        parts.append(f"+{result['ai_score'] // 5} explanation")
+        if result["speed_bonus"]:
+            parts.append("+5 fastest!")
+        if result["perfect_round"]:
+            parts.append("+10 perfect round!")
+        return parts
+
     def _get_statement(self, week: int, index: int) -> dict:
-        key = f"{week}:{index}"
+        statement, answer, explanation = STATEMENTS[index % len(STATEMENTS)]
         return {
-            "statement": self.weekly_stmt_text.get(key, ""),
-            "answer": self.weekly_stmt_answer.get(key, "TRUE"),
-            "explanation": self.weekly_stmt_explanation.get(key, ""),
+            "statement": statement,
+            "answer": answer,
+            "explanation": explanation,
         }
 
-    def _generate_weekly_statements(self) -> None:
-        week_num = self._get_week_number()
-
-        # Pre-written statements — no AI timeout risk.
-        # AI is still used for scoring player EXPLANATIONS (the fun part).
-        statements = [
-            {"statement": "The Great Wall of China is not visible from space with the naked eye.", "answer": "TRUE", "explanation": "Despite the myth, the wall is too narrow to see from orbit without aid."},
-            {"statement": "Honey never expires — archaeologists found 3000-year-old honey in Egyptian tombs that was still edible.", "answer": "TRUE", "explanation": "Honey's low moisture and acidic pH make it last indefinitely if sealed."},
-            {"statement": "A day on Venus is shorter than a year on Venus.", "answer": "TWIST", "explanation": "A day on Venus (243 Earth days) is actually LONGER than its year (225 Earth days)."},
-            {"statement": "Octopuses have three hearts and blue blood.", "answer": "TRUE", "explanation": "Two hearts pump blood to the gills; one pumps to the body. Copper-based blood is blue."},
-            {"statement": "The Eiffel Tower was originally built as a permanent structure for Paris.", "answer": "TWIST", "explanation": "It was built as a temporary exhibit for the 1889 World's Fair and was meant to be demolished."},
-            {"statement": "Bananas are technically berries, but strawberries are not.", "answer": "TRUE", "explanation": "Botanically, bananas qualify as berries; strawberries are accessory fruits."},
-            {"statement": "Mount Everest is the tallest mountain on Earth measured from sea level.", "answer": "TRUE", "explanation": "At 8,849m above sea level, Everest is the highest point on Earth."},
-            {"statement": "The human brain uses about 80% of the body's total energy.", "answer": "TWIST", "explanation": "The brain uses roughly 20% of the body's energy, not 80%."},
-            {"statement": "Lightning strikes the Earth about 100 times every second.", "answer": "TRUE", "explanation": "Earth experiences roughly 8 million lightning strikes per day — about 100 per second."},
-            {"statement": "Cleopatra lived closer in time to the Moon landing than to the construction of the Great Pyramid.", "answer": "TRUE", "explanation": "The pyramids were built ~2560 BC; Cleopatra lived ~30 BC; the Moon landing was 1969 AD."},
-        ]
-
-        for i, stmt in enumerate(statements):
-            key = f"{week_num}:{i}"
-            self.weekly_stmt_text[key] = stmt["statement"]
-            self.weekly_stmt_answer[key] = stmt["answer"]
-            self.weekly_stmt_explanation[key] = stmt["explanation"]
-
-        self.weekly_stmt_count = str(len(statements))
-        self.current_week_str = str(week_num)
-
     @gl.public.write
     def generate_statements(self) -> str:
-        """Call this once before the first game to generate weekly questions."""
+        """Call this once before the first game to open the weekly questions."""
         week_num = self._get_week_number()
-        self._generate_weekly_statements()
+        # STATEMENTS is module-level data - only the week and count are stored
+        self.weekly_stmt_count = str(len(STATEMENTS))
+        self.current_week_str = str(week_num)
         return f"Generated statements for week {week_num}"
 
     @gl.public.write
@@ -124,7 +231,8 @@ class TruthOrTwist(gl.Contract):
         self.room_status[room_id] = "waiting"
         self.room_current_round[room_id] = "0"
         self.room_statement_indices[room_id] = ",".join(indices)
-        self.room_final_ranking[room_id] = "[]"
+        self.room_ranking[room_id] = encode_ranking([(player_address, 0)])
+        self.room_final_ranking[room_id] = ""
         self.player_scores[f"{room_id}:{player_address}"] = "0"
 
         return room_id
@@ -146,6 +254,7 @@ class TruthOrTwist(gl.Contract):
 
         players.append(player_address)
         self.room_players[room_id] = ",".join(players)
+        self.room_ranking[room_id] = self.room_ranking.get(room_id, "") + f",{player_address}:0"
         self.player_scores[f"{room_id}:{player_address}"] = "0"
 
         return f"Joined {room_id}!"
@@ -203,8 +312,6 @@ class TruthOrTwist(gl.Contract):
             raise Exception("Already submitted this round!")
 
         self.submission_answers[sub_key] = answer
-        self.submission_explanations[sub_key] = explanation
-        self.submission_times[sub_key] = str(submission_time)
 
         rnd_key = f"{room_id}:{round_num}"
         existing = self.round_submitted.get(rnd_key, "")
@@ -213,6 +320,13 @@ class TruthOrTwist(gl.Contract):
         else:
             self.round_submitted[rnd_key] = existing + "," + player_address
 
+        row = encode_submission(player_address, answer, submission_time, explanation)
+        existing = self.round_submissions.get(rnd_key, "")
+        if existing == "":
+            self.round_submissions[rnd_key] = row
+        else:
+            self.round_submissions[rnd_key] = existing + RECORD_SEP + row
+
         return "Submitted!"
 
     @gl.public.write
@@ -224,12 +338,17 @@ class TruthOrTwist(gl.Contract):
         round_num = self.room_current_round.get(room_id, "0")
         players = self._split(self.room_players.get(room_id, ""))
 
+        # Every submission for the round in one read: addr -> (answer, time, explanation)
         rnd_key = f"{room_id}:{round_num}"
-        submitted = self._split(self.round_submitted.get(rnd_key, ""))
-        if len(submitted) < len(players):
+        record = self.round_submissions.get(rnd_key, "")
+        submissions = {}
+        for row in (record.split(RECORD_SEP) if record != "" else []):
+            addr, p_answer, t, p_explanation = decode_submission(row)
+            submissions[addr] = (p_answer, t, p_explanation)
+        if len(submissions) < len(players):
             return json.dumps({
                 "waiting": True,
-                "submitted": len(submitted),
+                "submitted": len(submissions),
                 "total": len(players),
             })
 
@@ -242,9 +361,7 @@ class TruthOrTwist(gl.Contract):
 
         player_lines = ""
         for addr in players:
-            sub_key = f"{room_id}:{round_num}:{addr}"
-            p_answer = self.submission_answers.get(sub_key, "?")
-            p_explanation = self.submission_explanations.get(sub_key, "")
+            p_answer, _, p_explanation = submissions[addr]
             short_id = addr[2:8]
             player_lines += (
                 f"\nPlayerID: {short_id}\n"
@@ -287,25 +404,21 @@ Rules:
         scoring_data = json.loads(raw_result)
         winner_short_id = scoring_data.get("winner_of_round", "")
 
-        timing = []
-        for addr in players:
-            sub_key = f"{room_id}:{round_num}:{addr}"
-            t = int(self.submission_times.get(sub_key, "0"))
-            timing.append((addr, t))
-        timing.sort(key=lambda x: x[1])
-
+        # Fastest correct answer in one pass; ties go to the earlier player
         first_correct = None
-        for addr, _ in timing:
-            sub_key = f"{room_id}:{round_num}:{addr}"
-            if self.submission_answers.get(sub_key, "") == correct_answer:
+        first_time = 0
+        for addr in players:
+            p_answer, t, _ = submissions[addr]
+            if p_answer == correct_answer and (first_correct is None or t < first_time):
                 first_correct = addr
-                break
+                first_time = t
 
         round_results = {}
+        rows = []
+        deltas = {}
         for addr in players:
             short_id = addr[2:8]
-            sub_key = f"{room_id}:{round_num}:{addr}"
-            p_answer = self.submission_answers.get(sub_key, "")
+            p_answer = submissions[addr][0]
             got_correct = p_answer == correct_answer
 
             xp = 0
@@ -317,7 +430,7 @@ Rules:
 
             score_entry = scoring_data.get("scores", {}).get(short_id, {})
             ai_score = int(score_entry.get("score", 0))
-            feedback = score_entry.get("feedback", "")
+            feedback = str(score_entry.get("feedback") or "")
             eq_xp = ai_score // 5
             xp += eq_xp
             parts.append(f"+{eq_xp} explanation")
@@ -332,9 +445,9 @@ Rules:
                 xp += 10
                 parts.append("+10 perfect round!")
 
-            score_key = f"{room_id}:{addr}"
-            old = int(self.player_scores.get(score_key, "0"))
-            self.player_scores[score_key] = str(old + xp)
+            deltas[addr] = xp
+            flags = (FLAG_FASTEST if speed else 0) | (FLAG_PERFECT if perfect else 0)
+            rows.append(encode_round_row(addr, p_answer, got_correct, ai_score, xp, flags, feedback))
 
             round_results[addr] = {
                 "answer": p_answer,
@@ -347,19 +460,18 @@ Rules:
                 "perfect_round": perfect,
             }
 
+        self.round_results[rnd_key] = encode_round_results(rows)
+        ranking = self._apply_xp(room_id, deltas)
+
         game_over = False
         if int(round_num) >= 5:
             self.room_status[room_id] = "finished"
-            self._finalize_game(room_id, players)
+            self._finalize_game(room_id)
             game_over = True
         else:
             self.room_current_round[room_id] = str(int(round_num) + 1)
 
-        current_scores = {}
-        for addr in players:
-            current_scores[addr] = int(
-                self.player_scores.get(f"{room_id}:{addr}", "0")
-            )
+        current_scores = dict(ranking)
 
         return json.dumps({
             "round_complete": True,
@@ -371,21 +483,13 @@ Rules:
             "game_over": game_over,
         })
 
-    def _finalize_game(self, room_id: str, players: list) -> None:
+    def _finalize_game(self, room_id: str) -> None:
 
-        scores = []
-        for addr in players:
-            score = int(self.player_scores.get(f"{room_id}:{addr}", "0"))
-            scores.append((addr, score))
-        scores.sort(key=lambda x: x[1], reverse=True)
-
-        ranking = [
-            {"rank": i + 1, "player": addr, "score": score}
-            for i, (addr, score) in enumerate(scores)
-        ]
-        self.room_final_ranking[room_id] = json.dumps(ranking)
+        # score_round keeps room_ranking in order, so finishing just freezes it
+        ranking = self.room_ranking.get(room_id, "")
+        self.room_final_ranking[room_id] = ranking
 
-        for i, (addr, score) in enumerate(scores):
+        for i, (addr, score) in enumerate(decode_ranking(ranking)):
             old_xp = int(self.lb_total_xp.get(addr, "0"))
             old_games = int(self.lb_games_played.get(addr, "0"))
             old_wins = int(self.lb_wins.get(addr, "0"))
@@ -411,9 +515,7 @@ Rules:
         players = self._split(self.room_players.get(room_id, ""))
         round_num = self.room_current_round.get(room_id, "0")
 
-        scores = {}
-        for addr in players:
-            scores[addr] = int(self.player_scores.get(f"{room_id}:{addr}", "0"))
+        scores = dict(decode_ranking(self.room_ranking.get(room_id, "")))
 
         state = {
             "room_id": room_id,
@@ -438,12 +540,39 @@ Rules:
             state["waiting_for"] = len(players) - len(submitted)
 
         if status == "finished":
-            state["final_ranking"] = json.loads(
-                self.room_final_ranking.get(room_id, "[]")
-            )
+            state["final_ranking"] = [
+                {"rank": i + 1, "player": addr, "score": score}
+                for i, (addr, score) in enumerate(
+                    decode_ranking(self.room_final_ranking.get(room_id, ""))
+                )
+            ]
 
         return state
 
+    @gl.public.view
+    def get_round_results(self, room_id: str, round_number: int) -> dict:
+
+        value = self.round_results.get(f"{room_id}:{round_number}", "")
+        if value == "":
+            raise Exception(f"Round {round_number} of {room_id} has not been scored!")
+
+        week = int(self.current_week_str)
+        indices = self._split(self.room_statement_indices.get(room_id, ""))
+        stmt = self._get_statement(week, int(indices[round_number - 1]))
+
+        round_results = {}
+        for result in decode_round_results(value):
+            result["xp_breakdown"] = self._xp_breakdown(result)
+            round_results[result.pop("player")] = result
+
+        return {
+            "room_id": room_id,
+            "round_number": round_number,
+            "correct_answer": stmt["answer"],
+            "real_explanation": stmt["explanation"],
+            "round_results": round_results,
+        }
+
     @gl.public.view
     def get_leaderboard(self) -> list:
 
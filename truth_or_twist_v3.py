@@ -3,6 +3,290 @@
 
 from genlayer import *
 import json
+import math
+
+# Weekly / season leaderboards keep only this many entries in their index
+LEADERBOARD_INDEX_SIZE = 100
+QUICK_MATCH_MAX_BATCH = 64
+VIEW_MAX_BATCH        = 50   # records per get_profiles_batch / get_rooms_batch call
+EXPORT_MAX_PAGE       = 50   # records per export_state_page call
+# A waiting room drops out of the open-room index once this many newer rooms exist
+# (it stays joinable by id). Also bounds how far the index is ever scanned.
+OPEN_ROOM_WINDOW      = 500
+EXPORT_KINDS          = ("profiles", "rooms", "statements", "rankings")
+
+# Per-room size and length, chosen at create_room
+DEFAULT_MAX_PLAYERS = 8
+DEFAULT_ROUNDS      = 5
+MIN_PLAYERS_LIMIT   = 2
+MAX_PLAYERS_LIMIT   = 32
+MAX_ROUNDS_LIMIT    = 20
+
+# Submissions close this long after a round opens (caller-supplied unix seconds, like
+# submission_time). After that, scoring proceeds without the players who didn't answer.
+ROUND_SECONDS = 30
+
+# Broadcast rooms: large streamer lobbies, judged in bounded chunks
+BROADCAST_MAX_PLAYERS = 200
+JUDGE_CHUNK_SIZE      = 25
+BROADCAST_TOP_K       = 10
+
+# Round XP (same rules as v2's on-chain scoring, plus AI score // 5)
+XP_CORRECT = 10
+XP_FASTEST = 5
+XP_PERFECT = 10
+
+# How AI output (scoring and question generation) reaches consensus:
+#   "leader"          - leader's result is accepted as-is (fast path, use with leader-only txs)
+#   "non_comparative" - validators check the leader's result against written criteria
+#   "comparative"     - validators re-run the judge and accept via scores_agree (scoring only)
+CONSENSUS_MODES         = ("leader", "non_comparative", "comparative")
+DEFAULT_CONSENSUS_MODE  = "leader"
+DEFAULT_SCORE_TOLERANCE = 10
+MAX_SCORE_TOLERANCE     = 50
+
+DIFFICULTY_TIERS = ("easy", "medium", "hard")
+# "mixed" rooms walk this pattern: 2 easy + 2 medium + 1 hard per 5 rounds
+MIXED_PATTERN = ("easy", "medium", "hard", "easy", "medium")
+
+# Built-in statements for weeks without AI questions. generate_statements only marks
+# the week as "fallback"; statements are read from here, never copied into storage.
+# (statement, answer, explanation, difficulty)
+FALLBACK_BANK = (
+    # easy
+    ("The Great Wall of China is not visible from space with the naked eye.", "TRUE", "Despite the myth, the wall is too narrow (~15 feet wide) to see from orbit without aid.", "easy"),
+    ("Honey never expires - archaeologists found 3000-year-old honey in Egyptian tombs that was still edible.", "TRUE", "Honey's low moisture and acidic pH prevent bacterial growth, making it last indefinitely if sealed.", "easy"),
+    ("Octopuses have three hearts and blue blood.", "TRUE", "Two hearts pump blood to the gills; one pumps to the body. Copper-based haemocyanin makes blood blue.", "easy"),
+    ("The Eiffel Tower was originally built as a permanent structure for Paris.", "TWIST", "It was built as a temporary exhibit for the 1889 World's Fair and was slated for demolition.", "easy"),
+    ("Bananas are technically berries, but strawberries are not.", "TRUE", "Botanically, bananas develop from a single flower with one ovary. Strawberries are 'accessory fruits'.", "easy"),
+    ("Lightning never strikes the same place twice.", "TWIST", "Lightning frequently strikes the same place multiple times - the Empire State Building is hit ~20-25 times per year.", "easy"),
+    ("Humans have five senses.", "TWIST", "Humans have at least 9 senses including proprioception, thermoception, nociception, and the vestibular sense.", "easy"),
+    ("Goldfish have a memory span of only 3 seconds.", "TWIST", "Studies show goldfish can remember things for months and can be trained to perform tasks.", "easy"),
+    ("Cleopatra lived closer in time to the Moon landing than to the construction of the Great Pyramid.", "TRUE", "The pyramids were built ~2560 BC; Cleopatra lived ~30 BC; the Moon landing was 1969 AD.", "easy"),
+    ("A day on Venus is shorter than a year on Venus.", "TWIST", "A Venus day (243 Earth days) is actually LONGER than its year (225 Earth days).", "easy"),
+    # medium
+    ("Mount Everest is the tallest mountain on Earth measured from its base.", "TWIST", "Mauna Kea is taller from base to peak (~10,210m), but most of it is underwater. Everest wins by sea-level height.", "medium"),
+    ("The human brain uses about 20% of the body's total energy.", "TRUE", "The brain is only 2% of body weight but consumes ~20% of total caloric energy.", "medium"),
+    ("Lightning strikes the Earth about 100 times every second.", "TRUE", "Earth experiences roughly 8 million lightning strikes per day - about 100 per second.", "medium"),
+    ("Water always boils at 100°C (212°F).", "TWIST", "Boiling point varies with altitude and pressure. At the top of Everest, water boils at ~70°C.", "medium"),
+    ("Napoleon Bonaparte was unusually short for his era.", "TWIST", "Napoleon was ~5'7\" (170cm) - average to tall for the time. The 'short Napoleon' myth stemmed from British propaganda.", "medium"),
+    ("Sharks are the only fish that cannot blink.", "TWIST", "Most fish don't have eyelids. Some sharks do have a nictitating membrane - a protective third eyelid.", "medium"),
+    ("The Amazon River flows into the Atlantic Ocean.", "TRUE", "The Amazon discharges into the Atlantic near Marajó Island in Brazil, pushing freshwater 160km into the ocean.", "medium"),
+    ("Oxford University is older than the Aztec Empire.", "TRUE", "Oxford started teaching around 1096-1167. The Aztec Empire was founded in 1428.", "medium"),
+    ("Diamonds are the hardest natural substance on Earth.", "TRUE", "Diamonds score 10 on the Mohs scale - the maximum. Nothing natural scratches a diamond.", "medium"),
+    ("The tongue has different zones for detecting different tastes.", "TWIST", "The 'tongue map' is a myth. All taste buds can detect all five basic tastes across the entire tongue.", "medium"),
+    ("Sound travels faster through water than through air.", "TRUE", "Sound travels ~1480 m/s in water vs ~343 m/s in air because water molecules are more tightly packed.", "medium"),
+    ("A group of flamingos is called a flamboyance.", "TRUE", "Flamingo groups are officially called a flamboyance, pat, colony, or stand.", "medium"),
+    ("The Great Fire of London in 1666 killed thousands of people.", "TWIST", "Remarkably, only 6 deaths were officially recorded in the Great Fire of London despite 13,000 homes destroyed.", "medium"),
+    ("Glass is a liquid that flows very slowly over time.", "TWIST", "Glass is an amorphous solid. Old windows are thicker at the bottom due to manufacturing techniques, not flow.", "medium"),
+    ("Butterflies taste with their feet.", "TRUE", "Butterflies have taste sensors on their tarsi (feet) to identify plants for egg-laying and food.", "medium"),
+    ("The human body contains about 37 trillion cells.", "TRUE", "Current estimates put human cell count at 37 trillion, with red blood cells being the most numerous.", "medium"),
+    ("Walt Disney was the first voice of Mickey Mouse.", "TRUE", "Walt Disney voiced Mickey Mouse from 1928 until 1947 when he handed the role to Jim Macdonald.", "medium"),
+    ("All planets in our solar system rotate in the same direction.", "TWIST", "Venus rotates clockwise (retrograde), and Uranus rotates on its side. Most others rotate counterclockwise.", "medium"),
+    # hard
+    ("Cats can't taste sweetness.", "TRUE", "Cats lack the Tas1r2 gene required to detect sweet flavours - they have no functional sweet taste receptor.", "hard"),
+    ("The word 'set' has the most definitions of any word in the English dictionary.", "TRUE", "In the Oxford English Dictionary, 'set' has 430+ definitions - more than any other word.", "hard"),
+    ("The Sahara Desert has always been a desert.", "TWIST", "Around 6,000-11,000 years ago the Sahara was green and had lakes, rivers, and hippos. This is called the 'Green Sahara'.", "hard"),
+    ("You cannot hum while holding your nose closed.", "TRUE", "Humming requires air to escape through the nose. Pinch your nose and the hum stops.", "hard"),
+    ("The first computer bug was an actual bug.", "TRUE", "In 1947, Grace Hopper's team found a moth in a Harvard Mark II relay - the first literal computer bug.", "hard"),
+    ("Hot water freezes faster than cold water.", "TRUE", "This is the Mpemba effect. Under certain conditions hot water does freeze faster, though scientists still debate the mechanism.", "hard"),
+    ("Wombat droppings are cube-shaped.", "TRUE", "Wombats produce cube-shaped scat due to the last 8% of their intestine stretching at different rates. Unique in the animal kingdom.", "hard"),
+    ("The shortest war in history lasted 38 minutes.", "TRUE", "The Anglo-Zanzibar War of 1896 lasted between 38 and 45 minutes - the shortest war ever recorded.", "hard"),
+    ("Humans share about 50% of their DNA with bananas.", "TRUE", "Approximately 50% of human genes are shared with bananas due to common cellular machinery inherited from a common ancestor.", "hard"),
+    ("Pluto is smaller than the United States.", "TRUE", "Pluto's surface area (~17.6M km²) is smaller than Russia, and about 1.5× the size of the contiguous US.", "hard"),
+    ("A single strand of spaghetti is called a spaghetto.", "TRUE", "Grammatically correct Italian singular of 'spaghetti' (plural) is 'spaghetto'. Same logic applies to panino/panini.", "hard"),
+    ("There are more possible chess games than atoms in the observable universe.", "TRUE", "The Shannon number estimates 10^120 possible chess games vs ~10^80 atoms in the observable universe.", "hard"),
+    ("Humans are the only animals that cook their food.", "TRUE", "No other animal deliberately applies heat to transform food. Cooking is considered a key driver of human brain evolution.", "hard"),
+    ("The inventor of the World Wide Web invented it in the USA.", "TWIST", "Tim Berners-Lee invented the WWW in 1989 while working at CERN in Geneva, Switzerland.", "hard"),
+    ("Crows can recognise and remember human faces.", "TRUE", "Studies show crows can recognise individual humans, hold grudges, and even warn other crows about 'dangerous' faces.", "hard"),
+    ("A day on Mercury is longer than a year on Mercury.", "TRUE", "Mercury rotates so slowly that one solar day (176 Earth days) is longer than its orbital year (88 Earth days).", "hard"),
+    ("The average human walks about 100,000 miles in a lifetime.", "TRUE", "Averaging ~7,500 steps/day over a lifetime, most people walk about 100,000 miles - equivalent to 4 trips around Earth.", "hard"),
+    ("There are more trees on Earth than stars in the Milky Way.", "TRUE", "Earth has ~3 trillion trees; the Milky Way has an estimated 100-400 billion stars.", "hard"),
+    ("Helium was first discovered on Earth before it was discovered in space.", "TWIST", "Helium was discovered in the sun's spectrum in 1868 (hence 'helios') before being found on Earth in 1895.", "hard"),
+    ("A teaspoon of a neutron star would weigh about 10 million tons.", "TRUE", "Neutron stars have densities of ~4×10^17 kg/m³. A teaspoon (~5mL) would weigh roughly 10 million metric tons on Earth.", "hard"),
+    ("The letter 'E' appears in the US Declaration of Independence more than any other letter.", "TRUE", "'E' is the most common letter in English. In the Declaration, 'e' appears over 1,300 times.", "hard"),
+)
+FALLBACK_POOLS = {tier: tuple(i for i, q in enumerate(FALLBACK_BANK) if q[3] == tier) for tier in DIFFICULTY_TIERS}
+
+# -- COMPACT RECORD CODEC ------------------------------
+# Versioned fixed-field encodings for stored rankings and round results.
+# The same block lives in every contract version - keep the copies identical.
+#   ranking:       "K1;addr:score,addr:score,..."          (rank = position)
+#   round results: "R1" RS row RS row ...                    (RS = \x1e)
+#   row:           addr US answer US correct US ai_score US xp US flags US feedback   (US = \x1f)
+#   submission:    addr US answer US time US explanation
+RANKING_CODEC = "K1;"
+ROUND_CODEC   = "R1"
+RECORD_SEP    = "\x1e"
+FIELD_SEP     = "\x1f"
+FLAG_FASTEST  = 1
+FLAG_PERFECT  = 2
+
+
+def encode_ranking(entries: list) -> str:
+    return RANKING_CODEC + ",".join(f"{addr}:{score}" for addr, score in entries)
+
+
+def decode_ranking(value: str) -> list:
+    """[(addr, score), ...] in rank order."""
+    if not value:
+        return []
+    if value.startswith(RANKING_CODEC):
+        value = value[len(RANKING_CODEC):]
+    entries = []
+    for item in value.split(","):
+        if item:
+            addr, _, score = item.partition(":")
+            entries.append((addr, int(score or "0")))
+    return entries
+
+
+def encode_round_row(address: str, answer: str, correct: bool, ai_score: int, xp: int, flags: int, feedback: str) -> str:
+    feedback = feedback.replace(RECORD_SEP, " ").replace(FIELD_SEP, " ")
+    return FIELD_SEP.join((address, answer, "1" if correct else "0", str(ai_score), str(xp), str(flags), feedback))
+
+
+def decode_round_row(row: str) -> dict:
+    address, answer, correct, ai_score, xp, flags, feedback = row.split(FIELD_SEP)
+    return {
+        "player":        address,
+        "answer":        answer,
+        "correct":       correct == "1",
+        "ai_score":      int(ai_score),
+        "ai_feedback":   feedback,
+        "round_xp":      int(xp),
+        "speed_bonus":   bool(int(flags) & FLAG_FASTEST),
+        "perfect_round": bool(int(flags) & FLAG_PERFECT),
+    }
+
+
+def encode_submission(address: str, answer: str, time: int, explanation: str) -> str:
+    explanation = explanation.replace(RECORD_SEP, " ").replace(FIELD_SEP, " ")
+    return FIELD_SEP.join((address, answer, str(time), explanation))
+
+
+def decode_submission(row: str) -> tuple:
+    """(addr, answer, time, explanation)"""
+    address, answer, time, explanation = row.split(FIELD_SEP)
+    return address, answer, int(time), explanation
+
+
+def encode_round_results(rows: list) -> str:
+    """Pack rows built with encode_round_row into one versioned record."""
+    return RECORD_SEP.join([ROUND_CODEC] + rows)
+
+
+def decode_round_results(value: str) -> list:
+    if not value:
+        return []
+    parts = value.split(RECORD_SEP)
+    if parts[0] != ROUND_CODEC:
+        raise Exception(f"Unknown round results encoding: {parts[0]}")
+    return [decode_round_row(row) for row in parts[1:]]
+
+
+# -- EVENT LOG -----------------------------------------
+# Write methods append typed events under increasing sequence numbers so an
+# indexer can tail get_events_since instead of polling full state.
+#   event:  type US field US field ...   (fields in EVENT_FIELDS order)
+EVENT_FIELDS = {
+    "room_created":     ("room_id", "host"),
+    "player_joined":    ("room_id", "player"),
+    "answer_submitted": ("room_id", "round", "player"),
+    "round_scored":     ("room_id", "round"),
+    "game_finished":    ("room_id", "winner"),
+    "profile_updated":  ("player",),
+}
+EVENTS_MAX_PAGE  = 100   # events per get_events_since call
+EVENTS_PRUNE_MAX = 500   # entries deleted per prune_events call
+
+
+def encode_event(kind: str, *fields) -> str:
+    if len(fields) != len(EVENT_FIELDS[kind]):
+        raise Exception(f"Event {kind} takes {len(EVENT_FIELDS[kind])} fields")
+    return FIELD_SEP.join((kind,) + tuple(str(f) for f in fields))
+
+
+def decode_event(value: str) -> dict:
+    kind, *fields = value.split(FIELD_SEP)
+    event = {"type": kind}
+    for name, field in zip(EVENT_FIELDS.get(kind, ()), fields):
+        event[name] = int(field) if name == "round" else field
+    return event
+
+
+# -- XP SCORING CORE -----------------------------------
+# Pure functions: no storage access, so a whole round is scored from plain
+# lists and the same code can be driven off-chain over synthetic rounds.
+
+def base_xp(correct: bool, ai_score: int) -> int:
+    """XP before round bonuses: XP_CORRECT for the right answer plus AI score // 5."""
+    return (XP_CORRECT if correct else 0) + ai_score // 5
+
+
+def score_round_xp(answers: list, times: list, ai_scores: list, correct_answer: str) -> list:
+    """
+    Score one round from parallel lists, in one pass.
+    The earliest correct answer gets XP_FASTEST. The highest AI score gets
+    XP_PERFECT if that answer is also correct. Ties go to the earlier entry.
+    Returns [(xp, flags), ...] aligned with the inputs (flags: FLAG_FASTEST | FLAG_PERFECT).
+    """
+    xps     = []
+    fastest = best = -1
+    for i, (answer, t, ai_score) in enumerate(zip(answers, times, ai_scores)):
+        correct = answer == correct_answer
+        xps.append(base_xp(correct, ai_score))
+        if correct and (fastest < 0 or t < times[fastest]):
+            fastest = i
+        if best < 0 or ai_score > ai_scores[best]:
+            best = i
+
+    flags = [0] * len(xps)
+    if fastest >= 0:
+        xps[fastest]   += XP_FASTEST
+        flags[fastest] |= FLAG_FASTEST
+    if best >= 0 and answers[best] == correct_answer:
+        xps[best]   += XP_PERFECT
+        flags[best] |= FLAG_PERFECT
+    return list(zip(xps, flags))
+
+
+def scores_agree(leader: list, mine: list, tolerance: int) -> bool:
+    """
+    Deterministic comparator for comparative judging. Accept the leader's AI
+    scores when every player's score is within `tolerance` of ours and the
+    leader's top scorer is also a top scorer in ours.
+    """
+    if len(leader) != len(mine):
+        return False
+    if not leader:
+        return True
+    if any(abs(a - b) > tolerance for a, b in zip(leader, mine)):
+        return False
+    return mine[leader.index(max(leader))] == max(mine)
+
+
+# -- NICKNAMES -----------------------------------------
+# nickname_owner is keyed by this normal form, so "Alice" and " alice " collide.
+
+def normalize_nickname(nickname: str) -> str:
+    """Index key for nickname uniqueness: case-folded, inner whitespace collapsed."""
+    return " ".join(nickname.split()).casefold()
+
+
+# -- STATEMENT ORDER -----------------------------------
+# Rooms derive their statements from a permutation instead of storing a list.
+
+def permute_index(position: int, size: int, seed: int) -> int:
+    """
+    Element `position` (mod `size`) of a seed-keyed permutation of range(size):
+    an affine map with a step coprime to `size`, so `size` consecutive positions
+    never repeat. Pure integer arithmetic - identical on every validator.
+    """
+    step = 2 * seed + 5
+    while math.gcd(step, size) != 1:
+        step += 1
+    return (step * position + seed) % size
 
 
 class TruthOrTwist(gl.Contract):
@@ -12,16 +296,39 @@ class TruthOrTwist(gl.Contract):
     room_players:           TreeMap[str, str]
     room_status:            TreeMap[str, str]
     room_current_round:     TreeMap[str, str]
-    room_statement_indices: TreeMap[str, str]
-    room_final_ranking:     TreeMap[str, str]
+    room_week:              TreeMap[str, str]   # week whose statements the room plays
+    room_difficulty:        TreeMap[str, str]   # "mixed" / "easy" / "medium" / "hard"
+    room_total_rounds:      TreeMap[str, str]
+    room_max_players:       TreeMap[str, str]
+    room_player_count:      TreeMap[str, str]
+    room_member:            TreeMap[str, str]   # "room_id:player_addr" -> "1"
+    room_mode:              TreeMap[str, str]   # "standard" (default) / "broadcast"
+    room_consensus:         TreeMap[str, str]   # scoring consensus mode, unset = DEFAULT_CONSENSUS_MODE
+    room_tolerance:         TreeMap[str, str]   # comparative judging score gap fixed at creation, unset = DEFAULT_SCORE_TOLERANCE
+    room_ranking:           TreeMap[str, str]   # encode_ranking(...) kept in rank order as XP is applied
+    room_top:               TreeMap[str, str]   # broadcast: first BROADCAST_TOP_K entries of room_ranking
+    room_final_ranking:     TreeMap[str, str]   # room_ranking frozen when the game finishes
+    room_rounds_judged:     TreeMap[str, str]   # standard rooms: rounds judged so far, in any order
     room_counter:           str
+    # Joinable rooms ("waiting", free seats) in creation order: open_room_slot[str(n)] = room_id
+    # for open_head <= n < open_tail, with gaps where rooms filled up or started
+    open_room_slot:         TreeMap[str, str]
+    open_room_pos:          TreeMap[str, str]   # room_id -> its n in open_room_slot
+    open_head:              str
+    open_tail:              str
 
     # -- ANSWERS & SCORING ---------------------------------
     player_scores:          TreeMap[str, str]
-    submission_answers:     TreeMap[str, str]
-    submission_explanations:TreeMap[str, str]
-    submission_times:       TreeMap[str, str]
-    round_submitted:        TreeMap[str, str]
+    submission_slot:        TreeMap[str, str]   # "room_id:round:addr" -> n, its place in round_submission
+    round_deadline:         TreeMap[str, str]   # "room_id:round" -> time submissions close (unset = wait for all)
+    round_submit_count:     TreeMap[str, str]   # "room_id:round" -> number of submissions
+    round_submission:       TreeMap[str, str]   # "room_id:round:n" -> encode_submission(...) of the nth submitter
+    submission_score:       TreeMap[str, str]   # "room_id:round:addr" -> "ai_score" US "feedback", from judge_submission
+    round_judged:           TreeMap[str, str]   # "room_id:round" -> submitters judged so far
+    round_state:            TreeMap[str, str]   # "room_id:round" -> "closed" / "judged" (standard rooms)
+    round_leaders:          TreeMap[str, str]   # "room_id:round" -> "fast_addr,fast_time,best_addr,best_score"
+    round_consensus:        TreeMap[str, str]   # "room_id:round" -> consensus mode scoring ran under
+    round_results:          TreeMap[str, str]   # "room_id:round" -> encode_round_results(...), one row per judged player
 
     # -- AI-GENERATED WEEKLY QUESTIONS ---------------------
     # Stored as week:index -> field
@@ -29,9 +336,17 @@ class TruthOrTwist(gl.Contract):
     weekly_stmt_answer:     TreeMap[str, str]
     weekly_stmt_explanation:TreeMap[str, str]
     weekly_stmt_difficulty: TreeMap[str, str]
+    weekly_diff_pool:       TreeMap[str, str]   # "week:tier" -> comma-separated statement indices
     weekly_stmt_count:      str
+    weekly_source:          TreeMap[str, str]   # week -> "fallback" (FALLBACK_BANK) / "ai" (weekly_stmt_* maps)
     current_week_str:       str
     current_week_topic:     str   # the topic AI used this week
+    weekly_consensus:       TreeMap[str, str]   # week -> consensus mode generate_ai_questions ran under
+    weekly_locked:          TreeMap[str, str]   # week -> "1" once a room plays it; its statements can no longer change
+
+    # -- STATEMENT ANSWER STATS ----------------------------
+    # stmt_stats["week:index"] = "attempts,correct,ai_scored,ai_score_total"
+    stmt_stats:             TreeMap[str, str]
 
     # -- PLAYER PROFILES -----------------------------------
     # profile_<field>[address] = value
@@ -45,13 +360,46 @@ class TruthOrTwist(gl.Contract):
     profile_streak:         TreeMap[str, str]   # current win streak
     profile_best_streak:    TreeMap[str, str]
     all_players:            str                 # comma-separated registered addresses
+    nickname_owner:         TreeMap[str, str]   # normalize_nickname(nick) -> address holding it
+    player_index:           TreeMap[str, str]   # str(n) -> n-th indexed address (export order)
+    player_count:           str
+
+    # -- WEEKLY & SEASON LEADERBOARDS ----------------------
+    # weekly_xp["week:address"] / season_xp["season:address"] = xp earned in that window
+    weekly_xp:              TreeMap[str, str]
+    season_xp:              TreeMap[str, str]
+    # week / season -> encode_ranking(...) sorted by xp, capped at LEADERBOARD_INDEX_SIZE
+    weekly_top:             TreeMap[str, str]
+    season_top:             TreeMap[str, str]
+    season_length_weeks:    str                 # length of seasons that start from now on
+    current_season_str:     str
+    season_end_week:        str                 # last week of the current season, fixed when it starts
+
+    # -- GAME HISTORY --------------------------------------
+    # player_history["address:n"] = "room_id|week|score|rank" (n counts from 0)
+    player_history:         TreeMap[str, str]
+    player_history_count:   TreeMap[str, str]
+
+    # -- EVENT LOG -----------------------------------------
+    # event_log[str(seq)] = encode_event(...); seqs event_first..event_next-1 are retained
+    event_log:              TreeMap[str, str]
+    event_next:             str
+    event_first:            str
 
     def __init__(self) -> None:
-        self.weekly_stmt_count  = "0"
-        self.current_week_str   = "1"
-        self.current_week_topic = ""
-        self.all_players        = ""
-        self.room_counter       = "0"
+        self.weekly_stmt_count   = "0"
+        self.current_week_str    = "1"
+        self.current_week_topic  = ""
+        self.all_players         = ""
+        self.player_count        = "0"
+        self.room_counter        = "0"
+        self.open_head           = "0"
+        self.open_tail           = "0"
+        self.season_length_weeks = "4"
+        self.current_season_str  = "1"
+        self.season_end_week     = "4"
+        self.event_next          = "0"
+        self.event_first         = "0"
 
     # -- INTERNAL HELPERS ----------------------------------
 
@@ -60,7 +408,31 @@ class TruthOrTwist(gl.Contract):
             return []
         return [x for x in value.split(",") if x]
 
-    def _get_statement(self, week: int, index: int) -> dict:
+    def _is_fallback_week(self, week: int) -> bool:
+        """Weeks without AI questions - including ones nothing was generated for - play FALLBACK_BANK."""
+        return self.weekly_source.get(str(week), "") != "ai"
+
+    def _week_size(self, week: int) -> int:
+        """Statements available in `week`."""
+        if self._is_fallback_week(week):
+            return len(FALLBACK_BANK)
+        if week == int(self.current_week_str):
+            return int(self.weekly_stmt_count)
+        count = 0
+        while self.weekly_stmt_text.get(f"{week}:{count}", "") != "":
+            count += 1
+        return count
+
+    def _get_statement(self, week: int, index: int, fallback: bool = None) -> dict:
+        """`fallback` skips the source lookup when the caller already knows it."""
+        if self._is_fallback_week(week) if fallback is None else fallback:
+            statement, answer, explanation, difficulty = FALLBACK_BANK[index]
+            return {
+                "statement":   statement,
+                "answer":      answer,
+                "explanation": explanation,
+                "difficulty":  difficulty,
+            }
         key = f"{week}:{index}"
         return {
             "statement":   self.weekly_stmt_text.get(key, ""),
@@ -69,38 +441,445 @@ class TruthOrTwist(gl.Contract):
             "difficulty":  self.weekly_stmt_difficulty.get(key, "medium"),
         }
 
+    def _room_week(self, room_id: str) -> int:
+        return int(self.room_week.get(room_id, self.current_week_str))
+
+    def _index_difficulties(self, week: int, difficulties: list) -> None:
+        """Precompute the per-tier index lists room selection draws from."""
+        for tier in DIFFICULTY_TIERS:
+            pool = [str(i) for i, d in enumerate(difficulties) if d == tier]
+            self.weekly_diff_pool[f"{week}:{tier}"] = ",".join(pool)
+
+    def _tier_pool(self, week: int, tier: str, fallback: bool) -> list:
+        if fallback:
+            return list(FALLBACK_POOLS[tier])
+        return [int(x) for x in self._split(self.weekly_diff_pool.get(f"{week}:{tier}", ""))]
+
+    def _memo(self, memo: dict, key: tuple, load):
+        """Return memo[key], calling load() on a miss. memo=None disables sharing."""
+        if memo is None:
+            return load()
+        if key not in memo:
+            memo[key] = load()
+        return memo[key]
+
+    def _check_week_unlocked(self, week: int) -> None:
+        """Rooms derive their statements from the week's pools, so those are fixed once a room exists."""
+        if self.weekly_locked.get(str(week), "") != "":
+            raise Exception(f"Week {week} already has rooms - its statements are fixed until new_week()!")
+
+    def _statement_order(self, week: int, room_num: int, profile: str, rounds: int, count: int,
+                         fallback: bool, total: int, memo: dict = None) -> list:
+        """
+        First `count` statement indices of a `rounds`-round room, derived from
+        (week, room number) and the week's pools, which stop changing once the
+        week's first room exists (see _check_week_unlocked). Each tier walks its
+        pool in a week-keyed permutation. Rooms of the same length take
+        consecutive windows of a pool, as wide as the rounds they draw from it,
+        so neighbours only overlap once it wraps. A tier that is empty or used up borrows the next unused statement
+        of the week - never a repeat. Reads at most one pool per tier; `memo`
+        shares them across rooms of a batch.
+        """
+        total = total or 10
+        tiers = [profile if profile in DIFFICULTY_TIERS else MIXED_PATTERN[r % len(MIXED_PATTERN)] for r in range(max(count, rounds))]
+        share = {tier: tiers.count(tier) for tier in DIFFICULTY_TIERS}   # rounds per tier = window width
+        tiers = tiers[:count]
+
+        pools = {}
+        taken = {}      # tier -> rounds drawn from its pool so far
+        picks = []
+        for tier in tiers:
+            if tier not in pools:
+                pool = self._memo(memo, ("pool", week, fallback, tier), lambda: self._tier_pool(week, tier, fallback))
+                pools[tier] = pool or list(range(total))
+                taken[tier] = 0
+            pool   = pools[tier]
+            window = room_num * share[tier]
+            idx    = -1
+            while taken[tier] < len(pool):
+                candidate = pool[permute_index(window + taken[tier], len(pool), week)]
+                taken[tier] += 1
+                if candidate not in picks:
+                    idx = candidate
+                    break
+            if idx < 0:
+                # Tier exhausted - spill over to the next unused statement of the week
+                idx = (room_num * rounds + len(picks)) % total
+                while idx in picks and len(picks) < total:
+                    idx = (idx + 1) % total
+            picks.append(idx)
+        return picks
+
+    def _room_statement(self, room_id: str, round_num: int, memo: dict = None) -> tuple:
+        """(week, index, statement) shown in round `round_num` of a room."""
+        week     = self._room_week(room_id)
+        fallback = self._memo(memo, ("fallback", week), lambda: self._is_fallback_week(week))
+        total    = len(FALLBACK_BANK) if fallback else self._memo(memo, ("size", week), lambda: self._week_size(week))
+        profile  = self.room_difficulty.get(room_id, "mixed")
+        rounds   = int(self.room_total_rounds.get(room_id, str(DEFAULT_ROUNDS)))
+        index    = self._statement_order(week, self._room_number(room_id), profile, rounds, round_num, fallback, total, memo)[round_num - 1]
+        stmt     = self._memo(memo, ("stmt", week, index), lambda: self._get_statement(week, index, fallback))
+        return week, index, stmt
+
+    def _emit(self, kind: str, *fields) -> None:
+        """Append one event to the log (one write plus the sequence counter)."""
+        seq = int(self.event_next)
+        self.event_log[str(seq)] = encode_event(kind, *fields)
+        self.event_next = str(seq + 1)
+
+    def _bump_stmt_stats(self, key: str, attempts: int, correct: int, ai_scored: int, ai_total: int) -> None:
+        """Add deltas to a statement's running answer counters (one read, one write)."""
+        old = [int(x) for x in self.stmt_stats.get(key, "0,0,0,0").split(",")]
+        self.stmt_stats[key] = f"{old[0] + attempts},{old[1] + correct},{old[2] + ai_scored},{old[3] + ai_total}"
+
     def _ensure_profile(self, address: str) -> None:
-        """Create a blank profile if the player has never registered."""
+        """
+        Materialize a profile on its first non-default write. Profile fields are
+        sparse - an absent entry reads as "0"/"" - so only the registration
+        marker is stored here.
+        """
         if self.profile_join_nonce.get(address, "") == "":
             nonce = "reg_" + self.room_counter  # unique registration marker
             self.profile_join_nonce[address] = nonce
-            self.profile_total_xp[address]     = "0"
-            self.profile_games_played[address]  = "0"
-            self.profile_wins[address]          = "0"
-            self.profile_best_score[address]    = "0"
-            self.profile_streak[address]        = "0"
-            self.profile_best_streak[address]   = "0"
             # Add to global player list
             known = self._split(self.all_players)
             if address not in known:
                 self.all_players = (self.all_players + "," + address).lstrip(",")
+                n = int(self.player_count)
+                self.player_index[str(n)] = address
+                self.player_count = str(n + 1)
 
     def _touch_player(self, address: str) -> None:
-        """Record latest nonce for this player (proves on-chain activity)."""
-        self.profile_last_nonce[address] = self.room_counter  # records on-chain activity
+        """
+        Record latest nonce for this player (proves on-chain activity).
+        Stamped on registration and once per finished game, and skipped when unchanged.
+        """
+        if self.profile_last_nonce.get(address, "") != self.room_counter:
+            self.profile_last_nonce[address] = self.room_counter
+
+    def _set_nickname(self, address: str, nickname: str) -> bool:
+        """
+        Update nickname (trimmed, max 20 chars). Blank leaves it unchanged.
+        Nicknames are unique up to normalize_nickname; returns False (and
+        changes nothing) if another wallet holds it. A rename releases the old one.
+        """
+        nick = nickname.strip()[:20] if nickname else ""
+        old  = self.profile_nickname.get(address, "")
+        if not nick or nick == old:
+            return True
+        key   = normalize_nickname(nick)
+        owner = self.nickname_owner.get(key, "")
+        if owner and owner != address:
+            return False
+        old_key = normalize_nickname(old)
+        if old and old_key != key and self.nickname_owner.get(old_key, "") == address:
+            del self.nickname_owner[old_key]
+        self._ensure_profile(address)
+        self.profile_nickname[address] = nick
+        self.nickname_owner[key]       = address
+        self._emit("profile_updated", address)
+        return True
+
+    def _parse_llm_json(self, raw: str):
+        raw = raw.strip()
+
+        # Strip markdown code fences if present
+        if raw.startswith("```"):
+            lines = raw.split("\n")
+            raw = "\n".join(lines[1:])
+            if raw.endswith("```"):
+                raw = raw[:-3].strip()
+
+        return json.loads(raw)
+
+    def _check_consensus_mode(self, mode: str) -> None:
+        if mode not in CONSENSUS_MODES:
+            raise Exception("Consensus mode must be leader, non_comparative or comparative")
+
+    def _run_ai(self, prompt: str, mode: str, task: str, criteria: str) -> str:
+        """Run one prompt as "leader" or "non_comparative" and return the raw response."""
+        if mode == "leader":
+            return gl.exec_prompt(prompt)
+
+        def call_ai():
+            return gl.exec_prompt(prompt)
+
+        return gl.eq_principle_prompt_non_comparative(call_ai, task=task, criteria=criteria)
+
+    def _judge_explanations(
+        self,
+        stmt: dict,
+        entries: list,
+        mode: str = DEFAULT_CONSENSUS_MODE,
+        tolerance: int = DEFAULT_SCORE_TOLERANCE,
+    ) -> list:
+        """
+        Score [(answer, explanation), ...] 0-100 in one LLM call.
+        Players are labelled P1..Pn so address prefixes can't collide.
+        In comparative mode validators accept scores within `tolerance` points.
+        Returns [(score, feedback), ...] in input order.
+        """
+        player_lines = ""
+        for i, (answer, explanation) in enumerate(entries):
+            player_lines += (
+                f"\nPlayerID: P{i + 1}\n"
+                f"  Chose: {answer}\n"
+                f"  Explanation: {explanation}\n"
+            )
+
+        prompt = f"""You are an AI judge for a trivia game called Truth or Twist.
+
+STATEMENT SHOWN TO PLAYERS: "{stmt["statement"]}"
+CORRECT ANSWER: {stmt["answer"]}
+REAL EXPLANATION: {stmt["explanation"]}
+
+PLAYERS AND THEIR EXPLANATIONS:{player_lines}
+
+YOUR JOB: Score each player's explanation quality from 0 to 100.
+
+Scoring guide:
+80-100: Excellent - accurate, clear, well-reasoned
+60-79: Good - mostly correct with minor gaps
+40-59: Average - partially correct
+20-39: Weak - mostly wrong but shows thought
+0-19: Very poor - off topic or too short
+
+Rules:
+- Score explanation QUALITY regardless of their TRUE/TWIST choice
+- Respond ONLY with valid JSON parseable by json.loads(). No markdown.
+
+{{"scores": {{"P1": {{"score": 85, "feedback": "One sentence."}}}}}}"""
+
+        count = len(entries)
+
+        def parse(raw: str) -> list:
+            scores = self._parse_llm_json(raw).get("scores", {})
+            results = []
+            for i in range(count):
+                entry = scores.get(f"P{i + 1}", {})
+                results.append([max(0, min(100, int(entry.get("score", 0)))), str(entry.get("feedback", ""))])
+            return results
+
+        if mode == "comparative":
+            # Validators re-judge and compare numbers only - no second LLM pass over prose criteria
+            def judge() -> list:
+                return parse(gl.exec_prompt(prompt))
+
+            def validate(leaders_res) -> bool:
+                if not isinstance(leaders_res, gl.vm.Return):
+                    return False
+                leader = [score for score, _ in leaders_res.calldata]
+                return scores_agree(leader, [score for score, _ in judge()], tolerance)
+
+            results = gl.vm.run_nondet(judge, validate)
+        else:
+            criteria = (
+                "The response is valid JSON with a 'scores' object holding a 0-100 score and "
+                "one-sentence feedback for every PlayerID, and better explanations score higher."
+            )
+            results = parse(self._run_ai(prompt, mode, "Score player explanations for a trivia game round", criteria))
+        return [(int(score), str(feedback)) for score, feedback in results]
+
+    def _apply_xp(self, room_id: str, deltas: dict) -> None:
+        """
+        Add round XP to player scores and slide each player to its new place in
+        the room's running ranking. The ranking is read and written once per call.
+        """
+        entries = decode_ranking(self.room_ranking.get(room_id, ""))
+        for addr, xp in deltas.items():
+            if xp == 0:
+                continue
+            key   = f"{room_id}:{addr}"
+            total = int(self.player_scores.get(key, "0")) + xp
+            self.player_scores[key] = str(total)
+            self._place_ranked(entries, addr, total)
+        self.room_ranking[room_id] = encode_ranking(entries)
+        if self.room_mode.get(room_id, "standard") == "broadcast":
+            self.room_top[room_id] = encode_ranking(entries[:BROADCAST_TOP_K])
+
+    def _ranking_list(self, value: str) -> list:
+        return [
+            {"rank": i + 1, "player": addr, "score": score}
+            for i, (addr, score) in enumerate(decode_ranking(value))
+        ]
+
+    def _room_consensus(self, room_id: str, override: str) -> str:
+        """Per-call override if given, else the room's mode."""
+        mode = override or self.room_consensus.get(room_id, DEFAULT_CONSENSUS_MODE)
+        self._check_consensus_mode(mode)
+        return mode
+
+    def _room_tolerance(self, room_id: str) -> int:
+        return int(self.room_tolerance.get(room_id, str(DEFAULT_SCORE_TOLERANCE)))
+
+    def _check_score_tolerance(self, points: int) -> None:
+        if points < 0 or points > MAX_SCORE_TOLERANCE:
+            raise Exception(f"Score tolerance must be 0-{MAX_SCORE_TOLERANCE} points!")
+
+    def _set_room_consensus(self, room_id: str, consensus_mode: str, score_tolerance: int) -> None:
+        if consensus_mode != DEFAULT_CONSENSUS_MODE:
+            self.room_consensus[room_id] = consensus_mode
+        if score_tolerance != DEFAULT_SCORE_TOLERANCE:
+            self.room_tolerance[room_id] = str(score_tolerance)
+
+    def _check_room_config(self, difficulty: str, total_rounds: int, max_players: int, players_limit: int) -> None:
+        if difficulty != "mixed" and difficulty not in DIFFICULTY_TIERS:
+            raise Exception("Difficulty must be mixed, easy, medium or hard")
+        if total_rounds < 1 or total_rounds > MAX_ROUNDS_LIMIT:
+            raise Exception(f"Rounds must be 1-{MAX_ROUNDS_LIMIT}!")
+        if max_players < MIN_PLAYERS_LIMIT or max_players > players_limit:
+            raise Exception(f"Room size must be {MIN_PLAYERS_LIMIT}-{players_limit} players!")
+
+    def _room_rounds(self, room_id: str) -> int:
+        return int(self.room_total_rounds.get(room_id, str(DEFAULT_ROUNDS)))
+
+    def _room_capacity(self, room_id: str) -> int:
+        return int(self.room_max_players.get(room_id, str(DEFAULT_MAX_PLAYERS)))
+
+    def _is_member(self, room_id: str, address: str) -> bool:
+        return self.room_member.get(f"{room_id}:{address}", "") != ""
+
+    def _add_member(self, room_id: str, address: str) -> None:
+        self.room_member[f"{room_id}:{address}"]   = "1"
+        self.player_scores[f"{room_id}:{address}"] = "0"
+
+    def _new_room(self, host: str, difficulty: str, rounds: int, max_players: int) -> str:
+        """Write a fresh waiting room. Callers decide whether it joins the open-room index."""
+        room_num = int(self.room_counter) + 1
+        self.room_counter = str(room_num)
+        room_id = f"ROOM-{room_num:04d}"
+
+        week = int(self.current_week_str)
+
+        self.room_host[room_id]              = host
+        self.room_players[room_id]           = host
+        self.room_status[room_id]            = "waiting"
+        self.room_current_round[room_id]     = "0"
+        self.room_week[room_id]              = str(week)
+        self.room_difficulty[room_id]        = difficulty
+        self.room_total_rounds[room_id]      = str(rounds)
+        self.room_max_players[room_id]       = str(max_players)
+        self.room_player_count[room_id]      = "1"
+        self.room_ranking[room_id]           = encode_ranking([(host, 0)])
+        self.room_final_ranking[room_id]     = ""
+        self.weekly_locked[str(week)]        = "1"
+        self._add_member(room_id, host)
+        self._emit("room_created", room_id, host)
+        return room_id
+
+    def _open_round(self, room_id: str, round_num: int, now: int) -> None:
+        """Advance to `round_num`. With a clock (`now` > 0) the round closes ROUND_SECONDS later."""
+        self.room_current_round[room_id] = str(round_num)
+        if now > 0:
+            self.round_deadline[f"{room_id}:{round_num}"] = str(now + ROUND_SECONDS)
+
+    def _round_closed(self, rnd_key: str, now: int) -> bool:
+        deadline = int(self.round_deadline.get(rnd_key, "0"))
+        return deadline > 0 and now >= deadline
+
+    def _room_number(self, room_id: str) -> int:
+        return int(room_id.rsplit("-", 1)[1])
+
+    def _open_room_stale(self, room_id: str) -> bool:
+        return self._room_number(room_id) <= int(self.room_counter) - OPEN_ROOM_WINDOW
+
+    def _open_room_add(self, room_id: str) -> None:
+        tail = int(self.open_tail)
+        self.open_room_slot[str(tail)] = room_id
+        self.open_room_pos[room_id]    = str(tail)
+        self.open_tail = str(tail + 1)
+        self._open_room_prune()
+
+    def _open_room_remove(self, room_id: str) -> None:
+        pos = self.open_room_pos.get(room_id, "")
+        if pos:
+            del self.open_room_slot[pos]
+            del self.open_room_pos[room_id]
+            self._open_room_prune()
+
+    def _open_room_prune(self) -> None:
+        """Advance open_head past gaps and rooms older than OPEN_ROOM_WINDOW."""
+        head, tail = int(self.open_head), int(self.open_tail)
+        start = head
+        while head < tail:
+            room_id = self.open_room_slot.get(str(head), "")
+            if room_id and not self._open_room_stale(room_id):
+                break
+            if room_id:
+                del self.open_room_slot[str(head)]
+                del self.open_room_pos[room_id]
+            head += 1
+        if head != start:
+            self.open_head = str(head)
+
+    def _open_room_ids(self, limit: int) -> list:
+        """Up to `limit` joinable rooms, oldest first. Scans at most OPEN_ROOM_WINDOW slots."""
+        rooms = []
+        for n in range(int(self.open_head), int(self.open_tail)):
+            if len(rooms) >= limit:
+                break
+            room_id = self.open_room_slot.get(str(n), "")
+            if room_id and not self._open_room_stale(room_id):
+                rooms.append(room_id)
+        return rooms
+
+    def _place_ranked(self, entries: list, address: str, score: int) -> None:
+        """
+        Move `address` to its place in a score-sorted [(addr, score)] list, in
+        place and without re-sorting. Ties keep the earlier entry first.
+        """
+        for i, (addr, _) in enumerate(entries):
+            if addr == address:
+                entries.pop(i)
+                break
+        pos = len(entries)
+        for i, (_, other) in enumerate(entries):
+            if other < score:
+                pos = i
+                break
+        entries.insert(pos, (address, score))
+
+    def _bump_ranked(self, value: str, address: str, score: int, cap: int) -> str:
+        """Reposition `address` in a capped ranking index. Anything past `cap` falls off."""
+        entries = decode_ranking(value)
+        self._place_ranked(entries, address, score)
+        return encode_ranking(entries[:cap])
+
+    def _add_window_xp(self, counters: TreeMap, index: TreeMap, bucket: str, address: str, xp: int) -> None:
+        """Add XP to a weekly/season counter and reposition the player in its top index."""
+        key   = f"{bucket}:{address}"
+        total = int(counters.get(key, "0")) + xp
+        counters[key] = str(total)
+        index[bucket] = self._bump_ranked(index.get(bucket, ""), address, total, LEADERBOARD_INDEX_SIZE)
+
+    def _ranked_page(self, value: str, offset: int, limit: int) -> list:
+        entries = decode_ranking(value)
+        offset  = max(0, offset)
+        page    = entries[offset:offset + max(0, min(limit, LEADERBOARD_INDEX_SIZE))]
+        return [
+            {
+                "rank":     offset + i + 1,
+                "player":   addr,
+                "nickname": self.profile_nickname.get(addr, ""),
+                "xp":       xp,
+            }
+            for i, (addr, xp) in enumerate(page)
+        ]
 
     # ======================================================
     # AI WEEKLY QUESTION GENERATION
     # ======================================================
 
     @gl.public.write
-    def generate_ai_questions(self) -> str:
+    def generate_ai_questions(self, consensus_mode: str = DEFAULT_CONSENSUS_MODE) -> str:
         """
         Use GenLayer's AI to generate 10 fresh trivia questions for this week.
-        Call this with Leader Only mode - takes ~30-60s but runs reliably.
-        Questions rotate weekly by topic.
+        The default "leader" mode pairs with a Leader Only tx - takes ~30-60s but
+        runs reliably. Questions rotate weekly by topic.
         """
+        self._check_consensus_mode(consensus_mode)
         week_num = int(self.current_week_str)
+        self._check_week_unlocked(week_num)
 
         topics = [
             "science and nature",
@@ -141,21 +920,20 @@ Format exactly:
   ...
 ]"""
 
-        raw = gl.exec_prompt(prompt)
-        raw = raw.strip()
-
-        # Strip markdown code fences if present
-        if raw.startswith("```"):
-            lines = raw.split("\n")
-            raw = "\n".join(lines[1:])
-            if raw.endswith("```"):
-                raw = raw[:-3].strip()
-
-        questions = json.loads(raw)
-
-        # Validate and store
+        # Generated text never matches between runs, so "comparative" checks format like non_comparative
+        criteria = (
+            "The response is a JSON array of up to 10 objects, each with a one-sentence 'statement', "
+            "'answer' of TRUE or TWIST, a short 'explanation' and 'difficulty' of easy, medium or hard. "
+            "Both TRUE and TWIST answers appear."
+        )
+        mode = "non_comparative" if consensus_mode == "comparative" else consensus_mode
+        raw  = self._run_ai(prompt, mode, "Generate 10 trivia statements as a JSON array", criteria)
+        questions = self._parse_llm_json(raw)
+
+        # Validate and store (keys stay contiguous even if some entries are rejected)
         stored = 0
-        for i, q in enumerate(questions[:10]):
+        difficulties = []
+        for q in questions[:10]:
             stmt  = str(q.get("statement", "")).strip()
             ans   = str(q.get("answer", "TRUE")).strip().upper()
             expl  = str(q.get("explanation", "")).strip()
@@ -167,66 +945,72 @@ Format exactly:
             if diff not in ("easy", "medium", "hard"):
                 diff = "medium"
 
-            key = f"{week_num}:{i}"
+            key = f"{week_num}:{stored}"
             self.weekly_stmt_text[key]        = stmt
             self.weekly_stmt_answer[key]      = ans
             self.weekly_stmt_explanation[key] = expl
             self.weekly_stmt_difficulty[key]  = diff
+            difficulties.append(diff)
             stored += 1
 
+        if not stored:
+            raise Exception("AI returned no usable statements!")
+        self._index_difficulties(week_num, difficulties)
+        self.weekly_source[str(week_num)] = "ai"
         self.weekly_stmt_count = str(stored)
         self.current_week_str  = str(week_num)
+        self.weekly_consensus[str(week_num)] = mode
 
         return json.dumps({
             "week": week_num,
             "topic": topic,
             "questions_generated": stored,
+            "consensus_mode": mode,
         })
 
     @gl.public.write
     def generate_statements(self) -> str:
         """
-        Fallback: generate hardcoded statements if AI is unavailable.
+        Fallback: play the built-in FALLBACK_BANK this week if AI is unavailable.
+        One marker write - statements are resolved from the module-level table.
         Kept for compatibility with existing server startup code.
         """
         week_num = int(self.current_week_str)
-
-        fallback = [
-            {"statement": "The Great Wall of China is not visible from space with the naked eye.", "answer": "TRUE",  "explanation": "The wall is too narrow to see from orbit without optical aid.", "difficulty": "easy"},
-            {"statement": "Honey never expires - archaeologists found 3000-year-old honey still edible.", "answer": "TRUE",  "explanation": "Honey's low moisture and acidic pH prevent bacterial growth indefinitely.", "difficulty": "easy"},
-            {"statement": "A day on Venus is shorter than a year on Venus.", "answer": "TWIST", "explanation": "A Venus day (243 Earth days) is actually LONGER than its year (225 Earth days).", "difficulty": "easy"},
-            {"statement": "Octopuses have three hearts and blue blood.", "answer": "TRUE",  "explanation": "Two hearts pump to gills, one to body. Copper-based blood is blue.", "difficulty": "easy"},
-            {"statement": "The Eiffel Tower was built as a permanent Paris landmark.", "answer": "TWIST", "explanation": "It was a temporary exhibit for the 1889 World's Fair, slated for demolition.", "difficulty": "easy"},
-            {"statement": "Bananas are technically berries, but strawberries are not.", "answer": "TRUE",  "explanation": "Botanically, bananas are berries; strawberries are accessory fruits.", "difficulty": "medium"},
-            {"statement": "Mount Everest is the tallest mountain measured from its base.", "answer": "TWIST", "explanation": "Mauna Kea is taller base-to-peak; Everest wins only by sea-level height.", "difficulty": "medium"},
-            {"statement": "The human brain uses about 20% of the body's total energy.", "answer": "TRUE",  "explanation": "The brain is 2% of body weight but burns ~20% of all calories.", "difficulty": "medium"},
-            {"statement": "Lightning strikes the Earth about 100 times every second.", "answer": "TRUE",  "explanation": "Earth sees ~8 million strikes per day - roughly 100 per second.", "difficulty": "medium"},
-            {"statement": "Cleopatra lived closer in time to the Moon landing than to the Great Pyramid.", "answer": "TRUE",  "explanation": "Pyramids ~2560 BC, Cleopatra ~30 BC, Moon landing 1969 AD.", "difficulty": "hard"},
-        ]
-
-        for i, q in enumerate(fallback):
-            key = f"{week_num}:{i}"
-            self.weekly_stmt_text[key]        = q["statement"]
-            self.weekly_stmt_answer[key]      = q["answer"]
-            self.weekly_stmt_explanation[key] = q["explanation"]
-            self.weekly_stmt_difficulty[key]  = q["difficulty"]
-
-        self.weekly_stmt_count  = str(len(fallback))
+        self._check_week_unlocked(week_num)
+        self.weekly_source[str(week_num)] = "fallback"
+        self.weekly_stmt_count  = str(len(FALLBACK_BANK))
         self.current_week_topic = "mixed trivia"
 
-        return f"Loaded {len(fallback)} fallback statements for week {week_num}"
+        return f"Loaded {len(FALLBACK_BANK)} fallback statements for week {week_num}"
 
     @gl.public.write
     def new_week(self) -> str:
         """
         Advance to next week. Call this before generate_ai_questions() each week.
-        Clears nothing - old week data stays in storage for history.
+        Clears nothing - old week data stays in storage for history. Past the
+        current season's last week a new season starts, spanning the season
+        length set at that moment.
         """
         week_num = int(self.current_week_str) + 1
         self.current_week_str = str(week_num)
         self.weekly_stmt_count = "0"
+        if week_num > int(self.season_end_week):
+            self.current_season_str = str(int(self.current_season_str) + 1)
+            self.season_end_week    = str(week_num + int(self.season_length_weeks) - 1)
         return f"Advanced to week {week_num}"
 
+    @gl.public.write
+    def set_season_length(self, weeks: int) -> str:
+        """
+        Set how many weeks seasons span from the next one on. The current
+        season keeps the end week it started with, so past and running
+        seasons are never renumbered.
+        """
+        if weeks < 1 or weeks > 52:
+            raise Exception("Season length must be 1-52 weeks!")
+        self.season_length_weeks = str(weeks)
+        return f"Seasons from season {int(self.current_season_str) + 1} on span {weeks} weeks"
+
     # ======================================================
     # PLAYER PROFILES & REGISTRATION
     # ======================================================
@@ -238,14 +1022,13 @@ Format exactly:
         Updates nickname if already registered.
         Each call writes to the chain -> keeps wallet active on GenLayer.
         """
-        self._ensure_profile(address)
+        if not self._set_nickname(address, nickname):
+            raise Exception("Nickname already taken!")
+        if self.profile_join_nonce.get(address, "") == "":
+            self._ensure_profile(address)
+            self._emit("profile_updated", address)
         self._touch_player(address)
 
-        # Update nickname (trimmed, max 20 chars)
-        nick = nickname.strip()[:20] if nickname else ""
-        if nick:
-            self.profile_nickname[address] = nick
-
         nonce = self.profile_join_nonce.get(address, "")
         return json.dumps({
             "address": address,
@@ -290,12 +1073,24 @@ Format exactly:
             new_streak = 0
         new_bstrk = max(old_bstrk, new_streak)
 
-        self.profile_total_xp[address]    = str(new_xp)
-        self.profile_games_played[address] = str(new_games)
-        self.profile_wins[address]         = str(new_wins)
-        self.profile_best_score[address]   = str(new_best)
-        self.profile_streak[address]       = str(new_streak)
-        self.profile_best_streak[address]  = str(new_bstrk)
+        # Sparse fields: only write what changed (absent already reads as "0")
+        if new_xp != old_xp:
+            self.profile_total_xp[address]    = str(new_xp)
+        self.profile_games_played[address]    = str(new_games)
+        if new_wins != old_wins:
+            self.profile_wins[address]        = str(new_wins)
+        if new_best != old_best:
+            self.profile_best_score[address]  = str(new_best)
+        if new_streak != old_streak:
+            self.profile_streak[address]      = str(new_streak)
+        if new_bstrk != old_bstrk:
+            self.profile_best_streak[address] = str(new_bstrk)
+
+        if xp_earned > 0:
+            week = int(self.current_week_str)
+            self._add_window_xp(self.weekly_xp, self.weekly_top, str(week), address, xp_earned)
+            self._add_window_xp(self.season_xp, self.season_top, self.current_season_str, address, xp_earned)
+        self._emit("profile_updated", address)
 
         return json.dumps({
             "address": address,
@@ -306,79 +1101,187 @@ Format exactly:
         })
 
     # ======================================================
-    # ROOM LIFECYCLE (unchanged from v2 logic)
+    # ROOM LIFECYCLE
     # ======================================================
 
     @gl.public.write
-    def create_room(self, player_address: str) -> str:
-        self._ensure_profile(player_address)
-        self._touch_player(player_address)
-
-        room_num = int(self.room_counter) + 1
-        self.room_counter = str(room_num)
-        room_id = f"ROOM-{room_num:04d}"
-
-        total = int(self.weekly_stmt_count) if self.weekly_stmt_count != "0" else 10
-        start = room_num % max(1, total - 4)
-        indices = [str((start + i) % total) for i in range(5)]
-
-        self.room_host[room_id]              = player_address
-        self.room_players[room_id]           = player_address
-        self.room_status[room_id]            = "waiting"
-        self.room_current_round[room_id]     = "0"
-        self.room_statement_indices[room_id] = ",".join(indices)
-        self.room_final_ranking[room_id]     = "[]"
-        self.player_scores[f"{room_id}:{player_address}"] = "0"
+    def create_room(
+        self,
+        player_address: str,
+        difficulty: str = "mixed",
+        total_rounds: int = DEFAULT_ROUNDS,
+        max_players: int = DEFAULT_MAX_PLAYERS,
+        consensus_mode: str = DEFAULT_CONSENSUS_MODE,
+        score_tolerance: int = DEFAULT_SCORE_TOLERANCE,
+    ) -> str:
+        """
+        `score_tolerance` is the per-player AI score gap validators accept when
+        this room is judged in comparative mode. It is fixed for the room's life.
+        """
+        self._check_room_config(difficulty, total_rounds, max_players, MAX_PLAYERS_LIMIT)
+        self._check_consensus_mode(consensus_mode)
+        self._check_score_tolerance(score_tolerance)
+        room_id = self._new_room(player_address, difficulty, total_rounds, max_players)
+        self._set_room_consensus(room_id, consensus_mode, score_tolerance)
+        self._open_room_add(room_id)
+        return room_id
 
+    @gl.public.write
+    def create_broadcast_room(
+        self,
+        player_address: str,
+        difficulty: str = "mixed",
+        total_rounds: int = DEFAULT_ROUNDS,
+        max_players: int = BROADCAST_MAX_PLAYERS,
+        consensus_mode: str = DEFAULT_CONSENSUS_MODE,
+        score_tolerance: int = DEFAULT_SCORE_TOLERANCE,
+    ) -> str:
+        """
+        Large streamer room (up to 200 players). Rounds are judged with repeated
+        score_round_chunk calls and get_room_state only returns the top scores
+        plus the caller's own entry.
+        """
+        self._check_room_config(difficulty, total_rounds, max_players, BROADCAST_MAX_PLAYERS)
+        self._check_consensus_mode(consensus_mode)
+        self._check_score_tolerance(score_tolerance)
+        room_id = self._new_room(player_address, difficulty, total_rounds, max_players)
+        self.room_mode[room_id] = "broadcast"
+        self._set_room_consensus(room_id, consensus_mode, score_tolerance)
+        # Not listed in the open-room index: players join a streamer's room by id,
+        # quick_match and list_open_rooms only offer standard rooms
         return room_id
 
     @gl.public.write
     def join_room(self, room_id: str, player_address: str) -> str:
-        self._ensure_profile(player_address)
-        self._touch_player(player_address)
-
         status = self.room_status.get(room_id, "")
         if not status:
             raise Exception(f"Room {room_id} does not exist!")
         if status != "waiting":
             raise Exception("Game already started!")
 
-        players = self._split(self.room_players.get(room_id, ""))
-        if len(players) >= 8:
-            raise Exception("Room is full (max 8 players)!")
-        if player_address in players:
+        count    = int(self.room_player_count.get(room_id, "0"))
+        capacity = self._room_capacity(room_id)
+        if count >= capacity:
+            raise Exception(f"Room is full (max {capacity} players)!")
+        if self._is_member(room_id, player_address):
             raise Exception("Already in this room!")
 
-        players.append(player_address)
-        self.room_players[room_id] = ",".join(players)
-        self.player_scores[f"{room_id}:{player_address}"] = "0"
+        self.room_players[room_id]      = self.room_players.get(room_id, "") + "," + player_address
+        self.room_ranking[room_id]      = self.room_ranking.get(room_id, "") + f",{player_address}:0"
+        self.room_player_count[room_id] = str(count + 1)
+        self._add_member(room_id, player_address)
+        self._emit("player_joined", room_id, player_address)
+        if count + 1 >= capacity:
+            self._open_room_remove(room_id)
         return f"Joined {room_id}!"
 
     @gl.public.write
-    def start_game(self, room_id: str, host_address: str) -> str:
+    def quick_match(self, addresses: list, nickname_json: str) -> str:
+        """
+        Seat a batch of queued players in one transaction.
+        Fills open rooms oldest first, then opens new rooms (first player seated
+        becomes host). nickname_json is an optional {"address": "nickname"} map;
+        a nickname another wallet already holds is skipped, not an error, and
+        those players are listed in `nickname_rejected`. A player already
+        waiting in one of the open rooms is assigned that room, not a new seat.
+        Each touched room's player list is written once at the end.
+        """
+        if not addresses:
+            raise Exception("No players to match!")
+        if len(addresses) > QUICK_MATCH_MAX_BATCH:
+            raise Exception(f"Too many players (max {QUICK_MATCH_MAX_BATCH} per batch)!")
+        nicknames = json.loads(nickname_json) if nickname_json else {}
+        if not isinstance(nicknames, dict):
+            raise Exception("nickname_json must be a JSON object of address -> nickname!")
+
+        open_ids    = self._open_room_ids(len(addresses))
+        rosters     = {}    # room_id -> player list, loaded on first touch
+        joined      = {}    # room_id -> players seated by this call
+        assignments = {}
+        created     = []
+        rejected    = []
+        cursor      = 0     # rooms before this index are full
+
+        for addr in addresses:
+            if not addr or addr in assignments:
+                continue
+            if not self._set_nickname(addr, str(nicknames.get(addr, ""))):
+                rejected.append(addr)
+
+            placed = next((
+                room_id for room_id in open_ids
+                if (addr in rosters[room_id] if room_id in rosters else self._is_member(room_id, addr))
+            ), "")
+            for i in range(cursor, len(open_ids)):
+                if placed:
+                    break
+                room_id = open_ids[i]
+                if room_id not in rosters:
+                    rosters[room_id] = self._split(self.room_players.get(room_id, ""))
+                    joined[room_id]  = []
+                players = rosters[room_id]
+                if len(players) >= self._room_capacity(room_id):
+                    if i == cursor:
+                        cursor += 1
+                    continue
+                players.append(addr)
+                joined[room_id].append(addr)
+                self._add_member(room_id, addr)
+                self._emit("player_joined", room_id, addr)
+                placed = room_id
+                break
+
+            if not placed:
+                placed = self._new_room(addr, "mixed", DEFAULT_ROUNDS, DEFAULT_MAX_PLAYERS)
+                self._open_room_add(placed)
+                rosters[placed] = [addr]
+                joined[placed]  = []
+                open_ids.append(placed)
+                created.append(placed)
+            assignments[addr] = placed
+
+        for room_id, players in rosters.items():
+            self.room_players[room_id]      = ",".join(players)
+            self.room_player_count[room_id] = str(len(players))
+            if joined[room_id]:
+                # Waiting rooms are all on 0 XP, so new players rank last in join order
+                self.room_ranking[room_id] = ",".join(
+                    [self.room_ranking.get(room_id, "")] + [f"{a}:0" for a in joined[room_id]]
+                )
+            if len(players) >= self._room_capacity(room_id):
+                self._open_room_remove(room_id)
+
+        return json.dumps({
+            "assignments": assignments,
+            "rooms": {room_id: len(players) for room_id, players in rosters.items()},
+            "created": created,
+            "nickname_rejected": rejected,
+        })
+
+    @gl.public.write
+    def start_game(self, room_id: str, host_address: str, now: int = 0) -> str:
         status = self.room_status.get(room_id, "")
         if not status:
             raise Exception(f"Room {room_id} not found!")
         if self.room_host.get(room_id, "") != host_address:
             raise Exception("Only the host can start!")
-        players = self._split(self.room_players.get(room_id, ""))
-        if len(players) < 2:
+        if int(self.room_player_count.get(room_id, "0")) < 2:
             raise Exception("Need at least 2 players!")
         if status != "waiting":
             raise Exception("Game already started!")
 
-        self.room_status[room_id]         = "active"
-        self.room_current_round[room_id]  = "1"
+        self.room_status[room_id] = "active"
+        self._open_round(room_id, 1, now)
+        self._open_room_remove(room_id)
 
-        week    = int(self.current_week_str)
-        indices = self._split(self.room_statement_indices.get(room_id, ""))
-        stmt    = self._get_statement(week, int(indices[0]))
+        _, _, stmt = self._room_statement(room_id, 1)
         return stmt["statement"]
 
     @gl.public.write
     def submit_answer(
         self,
         room_id: str,
+        round_number: int,
         player_address: str,
         answer: str,
         explanation: str,
@@ -387,154 +1290,675 @@ Format exactly:
         if self.room_status.get(room_id, "") != "active":
             raise Exception("Game is not active!")
 
-        players = self._split(self.room_players.get(room_id, ""))
-        if player_address not in players:
+        if not self._is_member(room_id, player_address):
             raise Exception("You are not in this room!")
         if answer not in ("TRUE", "TWIST"):
             raise Exception("Answer must be TRUE or TWIST")
 
+        # An answer to a round that has already moved on must not land in the next one
         round_num = self.room_current_round.get(room_id, "0")
+        if int(round_number) != int(round_num):
+            raise Exception(f"Round {round_number} is not open!")
         sub_key   = f"{room_id}:{round_num}:{player_address}"
 
-        if self.submission_answers.get(sub_key, "") != "":
+        if self.submission_slot.get(sub_key, "") != "":
             raise Exception("Already submitted this round!")
 
-        self.submission_answers[sub_key]      = answer
-        self.submission_explanations[sub_key] = explanation or ""
-        self.submission_times[sub_key]        = str(submission_time)
+        rnd_key = f"{room_id}:{round_num}"
+        if self._round_closed(rnd_key, submission_time):
+            raise Exception("Round is closed!")
+        n       = int(self.round_submit_count.get(rnd_key, "0"))
+        self.submission_slot[sub_key]           = str(n)
+        self.round_submission[f"{rnd_key}:{n}"] = encode_submission(player_address, answer, submission_time, explanation or "")
+        self.round_submit_count[rnd_key]        = str(n + 1)
 
-        rnd_key  = f"{room_id}:{round_num}"
-        existing = self.round_submitted.get(rnd_key, "")
-        self.round_submitted[rnd_key] = (existing + "," + player_address).lstrip(",")
+        week, index, stmt = self._room_statement(room_id, int(round_num))
+        stmt_key = f"{week}:{index}"
+        correct  = 1 if answer == stmt["answer"] else 0
+        self._bump_stmt_stats(stmt_key, 1, correct, 0, 0)
+        self._emit("answer_submitted", room_id, round_num, player_address)
 
         return "Submitted!"
 
     @gl.public.write
-    def score_round(self, room_id: str) -> str:
-        """Server-side scoring handles XP - this just marks the round complete on-chain."""
+    def close_round(self, room_id: str, now: int = 0) -> str:
+        """
+        Stop taking answers for the current round and open the next one straight
+        away, without waiting for the AI. Closes once everyone has submitted or
+        `now` reaches the deadline. Judge the closed round with judge_round.
+        """
+        return json.dumps(self._close_round(room_id, now))
+
+    @gl.public.write
+    def judge_round(self, room_id: str, round_number: int, consensus_mode: str = "") -> str:
+        """
+        Judge a closed round in one LLM call and apply its XP with score_round_xp.
+        Rounds can be judged in any order while later rounds are played. Judging
+        a round twice returns the stored results without re-applying XP. The game
+        finishes when its last round has been closed and every round is judged.
+        """
+        return json.dumps(self._judge_round(room_id, round_number, consensus_mode))
+
+    @gl.public.write
+    def score_round(self, room_id: str, consensus_mode: str = "", now: int = 0) -> str:
+        """
+        close_round followed by judge_round, for callers that don't pipeline.
+        Waits until all players have submitted or `now` reaches the round deadline.
+        """
+        closed = self._close_round(room_id, now)
+        if closed.get("waiting"):
+            return json.dumps(closed)
+        return json.dumps(self._judge_round(room_id, closed["closed_round"], consensus_mode))
+
+    @gl.public.write
+    def judge_submission(self, room_id: str, round_number: int, player_address: str, consensus_mode: str = "") -> str:
+        """
+        Optional: AI-score one explanation as soon as it is submitted, while the
+        round is still being played. judge_round and score_round_chunk then
+        reuse the stored score and only prompt for submissions that were never
+        judged this way.
+        """
+        rnd_key = f"{room_id}:{round_number}"
+        sub_key = f"{rnd_key}:{player_address}"
+        slot    = self.submission_slot.get(sub_key, "")
+        if slot == "":
+            raise Exception("No submission to judge!")
+        # Standard rounds are judged whole; broadcast chunks judge submissions in slot order
+        if self.round_state.get(rnd_key, "") == "judged" or int(slot) < int(self.round_judged.get(rnd_key, "0")):
+            raise Exception(f"Round {round_number} is already judged!")
+
+        stored = self.submission_score.get(sub_key, "")
+        if stored == "":
+            _, _, stmt = self._room_statement(room_id, round_number)
+            _, answer, _, explanation = decode_submission(self.round_submission[f"{rnd_key}:{slot}"])
+            mode = self._room_consensus(room_id, consensus_mode)
+            score, feedback = self._judge_explanations(
+                stmt, [(answer, explanation)], mode, self._room_tolerance(room_id),
+            )[0]
+            stored = f"{score}{FIELD_SEP}{feedback.replace(FIELD_SEP, ' ')}"
+            self.submission_score[sub_key] = stored
+
+        score, _, feedback = stored.partition(FIELD_SEP)
+        return json.dumps({"player": player_address, "ai_score": int(score), "ai_feedback": feedback})
+
+    def _close_round(self, room_id: str, now: int) -> dict:
         if self.room_status.get(room_id, "") != "active":
             raise Exception("Game is not active!")
+        if self.room_mode.get(room_id, "standard") == "broadcast":
+            raise Exception("Broadcast rooms are scored with score_round_chunk!")
+
+        round_num = int(self.room_current_round.get(room_id, "0"))
+        rnd_key   = f"{room_id}:{round_num}"
+        submitted = int(self.round_submit_count.get(rnd_key, "0"))
+        total     = int(self.room_player_count.get(room_id, "0"))
+        if submitted < total and not self._round_closed(rnd_key, now):
+            return {
+                "waiting":   True,
+                "submitted": submitted,
+                "total":     total,
+                "deadline":  int(self.round_deadline.get(rnd_key, "0")),
+            }
 
-        round_num = self.room_current_round.get(room_id, "0")
-        players   = self._split(self.room_players.get(room_id, ""))
-        week      = int(self.current_week_str)
-        indices   = self._split(self.room_statement_indices.get(room_id, ""))
-        stmt      = self._get_statement(week, int(indices[int(round_num) - 1]))
+        self.round_state[rnd_key] = "closed"
+        last_round = round_num >= self._room_rounds(room_id)
+        result     = {"closed_round": round_num, "last_round": last_round}
+        if last_round:
+            self.room_status[room_id] = "judging"
+        else:
+            self._open_round(room_id, round_num + 1, now)
+            _, _, stmt = self._room_statement(room_id, round_num + 1)
+            result["next_round"]      = round_num + 1
+            result["next_statement"]  = stmt["statement"]
+            result["next_difficulty"] = stmt["difficulty"]
+        return result
+
+    def _judge_unscored(self, room_id: str, rnd_key: str, stmt: dict, players: list, entries: list, mode: str) -> list:
+        """
+        [(ai_score, feedback)] for each player's (answer, explanation). Scores
+        from judge_submission are reused; anything left is judged in one prompt.
+        """
+        judgements = []
+        missing    = []
+        for i, addr in enumerate(players):
+            stored = self.submission_score.get(f"{rnd_key}:{addr}", "")
+            if stored:
+                score, _, feedback = stored.partition(FIELD_SEP)
+                judgements.append((int(score), feedback))
+            else:
+                judgements.append(None)
+                missing.append(i)
+        if missing:
+            fresh = self._judge_explanations(stmt, [entries[i] for i in missing], mode, self._room_tolerance(room_id))
+            for i, judgement in zip(missing, fresh):
+                judgements[i] = judgement
+        return judgements
+
+    def _judge_round(self, room_id: str, round_number: int, consensus_mode: str) -> dict:
+        rnd_key = f"{room_id}:{round_number}"
+        state   = self.round_state.get(rnd_key, "")
+        if state == "":
+            raise Exception(f"Round {round_number} is not closed yet!")
+
+        week, index, stmt = self._room_statement(room_id, round_number)
+        if state == "judged":
+            return {
+                "round_complete":   True,
+                "already_judged":   True,
+                "round_number":     round_number,
+                "correct_answer":   stmt["answer"],
+                "real_explanation": stmt["explanation"],
+                "difficulty":       stmt["difficulty"],
+                "consensus_mode":   self.round_consensus.get(rnd_key, ""),
+                "round_results":    self._round_results_dict(self.round_results.get(rnd_key, "")),
+                "current_scores":   dict(decode_ranking(self.room_ranking.get(room_id, ""))),
+                "game_over":        self.room_status.get(room_id, "") == "finished",
+            }
 
-        game_over = int(round_num) >= 5
+        players, answers, times, entries = [], [], [], []
+        for n in range(int(self.round_submit_count.get(rnd_key, "0"))):
+            addr, answer, t, explanation = decode_submission(self.round_submission[f"{rnd_key}:{n}"])
+            players.append(addr)
+            answers.append(answer)
+            times.append(t)
+            entries.append((answer, explanation))
+
+        mode       = self._room_consensus(room_id, consensus_mode)
+        judgements = self._judge_unscored(room_id, rnd_key, stmt, players, entries, mode)
+        ai_scores  = [score for score, _ in judgements]
+        scored    = score_round_xp(answers, times, ai_scores, stmt["answer"])
+
+        rows, deltas = [], {}
+        for addr, answer, (ai_score, feedback), (xp, flags) in zip(players, answers, judgements, scored):
+            rows.append(encode_round_row(addr, answer, answer == stmt["answer"], ai_score, xp, flags, feedback))
+            deltas[addr] = xp
+        if len(players) < int(self.room_player_count.get(room_id, "0")):
+            # Closed by the deadline: players who never answered score zero
+            for addr in self._split(self.room_players.get(room_id, "")):
+                if addr not in deltas:
+                    rows.append(encode_round_row(addr, "", False, 0, 0, 0, ""))
+        record = encode_round_results(rows)
+        self.round_results[rnd_key]   = record
+        self.round_consensus[rnd_key] = mode
+        self.round_state[rnd_key]     = "judged"
+        self._bump_stmt_stats(f"{week}:{index}", 0, 0, len(ai_scores), sum(ai_scores))
+        self._apply_xp(room_id, deltas)
+        self._emit("round_scored", room_id, round_number)
+
+        judged = int(self.room_rounds_judged.get(room_id, "0")) + 1
+        self.room_rounds_judged[room_id] = str(judged)
+        game_over = self.room_status.get(room_id, "") == "judging" and judged >= self._room_rounds(room_id)
         if game_over:
             self.room_status[room_id] = "finished"
-            self._finalize_game(room_id, players)
-        else:
-            self.room_current_round[room_id] = str(int(round_num) + 1)
+            self._finalize_game(room_id)
 
-        return json.dumps({
-            "round_complete": True,
-            "round_number": int(round_num),
-            "correct_answer": stmt["answer"],
+        return {
+            "round_complete":   True,
+            "round_number":     round_number,
+            "correct_answer":   stmt["answer"],
             "real_explanation": stmt["explanation"],
-            "difficulty": stmt["difficulty"],
-            "game_over": game_over,
-        })
+            "difficulty":       stmt["difficulty"],
+            "consensus_mode":   mode,
+            "round_results":    self._round_results_dict(record),
+            "current_scores":   dict(decode_ranking(self.room_ranking.get(room_id, ""))),
+            "game_over":        game_over,
+        }
 
-    def _finalize_game(self, room_id: str, players: list) -> None:
-        scores = []
-        for addr in players:
-            score = int(self.player_scores.get(f"{room_id}:{addr}", "0"))
-            scores.append((addr, score))
-        scores.sort(key=lambda x: x[1], reverse=True)
+    @gl.public.write
+    def score_round_chunk(self, room_id: str, consensus_mode: str = "", now: int = 0) -> str:
+        """
+        Judge the next JUDGE_CHUNK_SIZE submissions of a broadcast room's round.
+        XP for correctness and explanation is applied per chunk. Once every player
+        has been judged - or every submission, after the round deadline - the
+        fastest/perfect bonuses are applied and the round advances. Call
+        repeatedly; each call is one bounded LLM prompt.
+        """
+        if self.room_status.get(room_id, "") != "active":
+            raise Exception("Game is not active!")
+        if self.room_mode.get(room_id, "standard") != "broadcast":
+            raise Exception("Chunked judging is only for broadcast rooms!")
+
+        round_num = int(self.room_current_round.get(room_id, "0"))
+        rnd_key   = f"{room_id}:{round_num}"
+        submitted = int(self.round_submit_count.get(rnd_key, "0"))
+        judged    = int(self.round_judged.get(rnd_key, "0"))
+        total     = int(self.room_player_count.get(room_id, "0"))
+        week, index, stmt = self._room_statement(room_id, round_num)
+
+        mode  = self._room_consensus(room_id, consensus_mode)
+        stop  = min(submitted, judged + JUDGE_CHUNK_SIZE)
+        batch = [decode_submission(self.round_submission[f"{rnd_key}:{n}"]) for n in range(judged, stop)]
+        if batch:
+            players    = [addr for addr, _, _, _ in batch]
+            entries    = [(answer, explanation) for _, answer, _, explanation in batch]
+            judgements = self._judge_unscored(room_id, rnd_key, stmt, players, entries, mode)
+
+            fast_addr, fast_time, best_addr, best_score = self.round_leaders.get(rnd_key, ",0,,-1").split(",")
+            fast_time, best_score = int(fast_time), int(best_score)
+            deltas = {}
+            rows   = []
+            for (addr, answer, t, _), (ai_score, feedback) in zip(batch, judgements):
+                correct = answer == stmt["answer"]
+                xp      = base_xp(correct, ai_score)
+                deltas[addr] = xp
+                rows.append(encode_round_row(addr, answer, correct, ai_score, xp, 0, feedback))
+
+                if correct and (fast_addr == "" or t < fast_time):
+                    fast_addr, fast_time = addr, t
+                if ai_score > best_score:
+                    best_addr, best_score = addr, ai_score
+
+            self._apply_xp(room_id, deltas)
+            self._append_round_rows(rnd_key, rows)
+            self.round_consensus[rnd_key] = mode
+            self._bump_stmt_stats(f"{week}:{index}", 0, 0, len(judgements), sum(score for score, _ in judgements))
+            self.round_leaders[rnd_key] = f"{fast_addr},{fast_time},{best_addr},{best_score}"
+            self.round_judged[rnd_key]  = str(stop)
+
+        round_complete = stop >= total or (stop >= submitted and self._round_closed(rnd_key, now))
+        game_over      = False
+        if round_complete:
+            self._apply_round_bonuses(room_id, rnd_key)
+            if stop < total:
+                self._append_missing_rows(room_id, rnd_key)
+            if not submitted:
+                self.round_consensus[rnd_key] = mode
+            self._emit("round_scored", room_id, round_num)
+            game_over = round_num >= self._room_rounds(room_id)
+            if game_over:
+                self.room_status[room_id] = "finished"
+                self._finalize_game(room_id)
+            else:
+                self._open_round(room_id, round_num + 1, now)
+
+        result = {
+            "round_number":   round_num,
+            "judged":         stop,
+            "submitted":      submitted,
+            "total":          total,
+            "round_complete": round_complete,
+            "game_over":      game_over,
+            "consensus_mode": mode,
+        }
+        if round_complete:
+            result["correct_answer"]   = stmt["answer"]
+            result["real_explanation"] = stmt["explanation"]
+        return json.dumps(result)
+
+    def _apply_round_bonuses(self, room_id: str, rnd_key: str) -> None:
+        """Fastest-correct and perfect-round bonuses, once a chunked round is fully judged."""
+        fast_addr, _, best_addr, _ = self.round_leaders.get(rnd_key, ",0,,-1").split(",")
+        records = self.round_results.get(rnd_key, "").split(RECORD_SEP)
+        where   = {row.split(FIELD_SEP, 1)[0]: i for i, row in enumerate(records) if i > 0}
+
+        bonuses = {}
+        if fast_addr:
+            bonuses[fast_addr] = [XP_FASTEST, 0]
+        if best_addr and decode_round_row(records[where[best_addr]])["correct"]:
+            bonuses.setdefault(best_addr, [0, 0])[1] = XP_PERFECT
+
+        for addr, (speed, perfect) in bonuses.items():
+            row   = decode_round_row(records[where[addr]])
+            flags = (FLAG_FASTEST if speed else 0) | (FLAG_PERFECT if perfect else 0)
+            records[where[addr]] = encode_round_row(
+                addr, row["answer"], row["correct"], row["ai_score"],
+                row["round_xp"] + speed + perfect, flags, row["ai_feedback"],
+            )
+        if bonuses:
+            self.round_results[rnd_key] = RECORD_SEP.join(records)
+        self._apply_xp(room_id, {addr: speed + perfect for addr, (speed, perfect) in bonuses.items()})
+
+    def _append_missing_rows(self, room_id: str, rnd_key: str) -> None:
+        """Zero rows for players who never answered a deadline-closed broadcast round."""
+        value    = self.round_results.get(rnd_key, "")
+        answered = {row.split(FIELD_SEP, 1)[0] for row in value.split(RECORD_SEP)[1:]}
+        missing  = [addr for addr in self._split(self.room_players.get(room_id, "")) if addr not in answered]
+        self._append_round_rows(rnd_key, [encode_round_row(addr, "", False, 0, 0, 0, "") for addr in missing])
+
+    def _round_results_dict(self, value: str) -> dict:
+        """Decode a stored round record into {addr: result} (score_round's round_results shape)."""
+        results = {}
+        for row in decode_round_results(value):
+            results[row.pop("player")] = row
+        return results
+
+    def _append_round_rows(self, rnd_key: str, rows: list) -> None:
+        value = self.round_results.get(rnd_key, "")
+        if value:
+            self.round_results[rnd_key] = RECORD_SEP.join([value] + rows)
+        else:
+            self.round_results[rnd_key] = encode_round_results(rows)
 
-        ranking = [
-            {"rank": i + 1, "player": addr, "score": score}
-            for i, (addr, score) in enumerate(scores)
-        ]
-        self.room_final_ranking[room_id] = json.dumps(ranking)
+    def _finalize_game(self, room_id: str) -> None:
+        """The running ranking is already in order - freeze it as the final ranking."""
+        ranking = self.room_ranking.get(room_id, "")
+        self.room_final_ranking[room_id] = ranking
+
+        week    = self._room_week(room_id)
+        entries = decode_ranking(ranking)
+        for i, (addr, score) in enumerate(entries):
+            n = int(self.player_history_count.get(addr, "0"))
+            self.player_history[f"{addr}:{n}"] = f"{room_id}|{week}|{score}|{i + 1}"
+            self.player_history_count[addr]    = str(n + 1)
+        self._emit("game_finished", room_id, entries[0][0] if entries else "")
+
+    @gl.public.write
+    def prune_events(self, before_seq: int) -> str:
+        """
+        Drop retained events with seq < before_seq, at most EVENTS_PRUNE_MAX per
+        call (call again to continue). Sequence numbers are never reused.
+        """
+        first = int(self.event_first)
+        stop  = min(before_seq, int(self.event_next), first + EVENTS_PRUNE_MAX)
+        for seq in range(first, stop):
+            del self.event_log[str(seq)]
+        if stop > first:
+            self.event_first = str(stop)
+        return json.dumps({"pruned": max(0, stop - first), "first_seq": max(first, stop)})
 
     # ======================================================
     # READ-ONLY VIEWS
     # ======================================================
 
+    @gl.public.view
+    def export_state_page(self, kind: str, cursor: str = "", limit: int = EXPORT_MAX_PAGE) -> dict:
+        """
+        Page through one kind of stored record to bootstrap a replica:
+          profiles   - registration order, cursor "n"
+          rooms      - room number order, cursor "n"
+          statements - (week, index) order, cursor "week:index"
+          rankings   - weekly leaderboards then season ones, cursor "week:n" / "season:n"
+        Pass next_cursor back to continue. Profiles, rooms and statements only ever
+        append, so a finished export resumes from its last next_cursor to pick up
+        new records; rankings change as XP is earned, so re-export them (or tail
+        get_events_since). Reads at most `limit` (<= EXPORT_MAX_PAGE) records.
+        """
+        if kind not in EXPORT_KINDS:
+            raise Exception(f"Export kind must be one of {', '.join(EXPORT_KINDS)}")
+        limit = max(1, min(limit, EXPORT_MAX_PAGE))
+        if kind == "profiles":
+            records, next_cursor, done = self._export_profiles(cursor, limit)
+        elif kind == "rooms":
+            records, next_cursor, done = self._export_rooms(cursor, limit)
+        elif kind == "statements":
+            records, next_cursor, done = self._export_statements(cursor, limit)
+        else:
+            records, next_cursor, done = self._export_rankings(cursor, limit)
+        return {"kind": kind, "records": records, "next_cursor": next_cursor, "done": done}
+
+    def _export_profiles(self, cursor: str, limit: int) -> tuple:
+        start = int(cursor or "0")
+        total = int(self.player_count)
+        stop  = max(start, min(total, start + limit))
+        records = [self._profile(self.player_index[str(n)]) for n in range(start, stop)]
+        return records, str(stop), stop >= total
+
+    def _export_rooms(self, cursor: str, limit: int) -> tuple:
+        start = int(cursor or "1")
+        total = int(self.room_counter)
+        stop  = max(start, min(total + 1, start + limit))
+        records = []
+        for n in range(start, stop):
+            room_id = f"ROOM-{n:04d}"
+            records.append({
+                "room_id":        room_id,
+                "host":           self.room_host.get(room_id, ""),
+                "status":         self.room_status.get(room_id, ""),
+                "mode":           self.room_mode.get(room_id, "standard"),
+                "consensus_mode": self.room_consensus.get(room_id, DEFAULT_CONSENSUS_MODE),
+                "score_tolerance": self._room_tolerance(room_id),
+                "week":           self._room_week(room_id),
+                "difficulty":     self.room_difficulty.get(room_id, "mixed"),
+                "total_rounds":   self._room_rounds(room_id),
+                "current_round":  int(self.room_current_round.get(room_id, "0")),
+                "ranking":        self._ranking_list(self.room_ranking.get(room_id, "")),
+            })
+        return records, str(stop), stop > total
+
+    def _export_statements(self, cursor: str, limit: int) -> tuple:
+        week, _, index = (cursor or "1:0").partition(":")
+        week, index = int(week), int(index or "0")
+        last  = int(self.current_week_str)
+        size  = self._week_size(week) if week <= last else 0
+        records = []
+        while week <= last and len(records) < limit:
+            if index >= size:
+                week, index = week + 1, 0
+                size = self._week_size(week) if week <= last else 0
+                continue
+            records.append({"week": week, "index": index, **self._get_statement(week, index)})
+            index += 1
+        return records, f"{week}:{index}", week > last
+
+    def _export_rankings(self, cursor: str, limit: int) -> tuple:
+        scope, _, n = (cursor or "week:1").partition(":")
+        n = int(n or "1")
+        last = {"week": int(self.current_week_str), "season": int(self.current_season_str)}
+        records = []
+        while scope in last and len(records) < limit:
+            if n > last[scope]:
+                scope, n = ("season", 1) if scope == "week" else ("", 0)
+                continue
+            index = self.weekly_top if scope == "week" else self.season_top
+            entries = self._ranked_page(index.get(str(n), ""), 0, LEADERBOARD_INDEX_SIZE)
+            records.append({"scope": scope, "id": n, "entries": entries})
+            n += 1
+        done = scope not in last
+        return records, "" if done else f"{scope}:{n}", done
+
+    @gl.public.view
+    def get_events_since(self, seq: int = 0, limit: int = EVENTS_MAX_PAGE) -> dict:
+        """
+        Events with sequence number >= seq, oldest first, at most EVENTS_MAX_PAGE.
+        Resume from next_seq. If seq was already pruned, the page starts at
+        first_seq - compare it with the requested seq to detect the gap.
+        """
+        first = int(self.event_first)
+        start = max(seq, first)
+        stop  = min(int(self.event_next), start + max(0, min(limit, EVENTS_MAX_PAGE)))
+        events = [{"seq": n, **decode_event(self.event_log[str(n)])} for n in range(start, stop)]
+        return {"events": events, "next_seq": stop if events else start, "first_seq": first}
+
     @gl.public.view
     def get_weekly_topic(self) -> dict:
+        week = int(self.current_week_str)
         return {
-            "week_number": int(self.current_week_str),
+            "week_number": week,
+            "season_number": int(self.current_season_str),
+            "season_end_week": int(self.season_end_week),
+            "season_length_weeks": int(self.season_length_weeks),
             "topic": self.current_week_topic or "Mixed Trivia",
-            "statements_ready": self.weekly_stmt_count != "0",
-            "total_statements": int(self.weekly_stmt_count),
+            "statements_ready": self.weekly_source.get(str(week), "") != "",
+            "statements_source": "fallback" if self._is_fallback_week(week) else "ai",
+            "total_statements": self._week_size(week),
+            "questions_consensus": self.weekly_consensus.get(str(week), ""),
+            "statements_locked": self.weekly_locked.get(str(week), "") != "",
         }
 
     @gl.public.view
     def get_weekly_questions(self) -> list:
         """Return all questions for the current week (for display/preview)."""
-        week  = int(self.current_week_str)
-        count = int(self.weekly_stmt_count)
-        qs = []
-        for i in range(count):
+        week = int(self.current_week_str)
+        return [{"index": i, **self._get_statement(week, i)} for i in range(self._week_size(week))]
+
+    @gl.public.view
+    def get_statement_stats(self, week: int = 0) -> list:
+        """Live answer counters for each statement of a week (defaults to the current week)."""
+        week  = week or int(self.current_week_str)
+        stats = []
+        for i in range(self._week_size(week)):
             key = f"{week}:{i}"
-            qs.append({
-                "index":       i,
-                "statement":   self.weekly_stmt_text.get(key, ""),
-                "answer":      self.weekly_stmt_answer.get(key, ""),
-                "explanation": self.weekly_stmt_explanation.get(key, ""),
-                "difficulty":  self.weekly_stmt_difficulty.get(key, "medium"),
+            attempts, correct, ai_scored, ai_total = [int(x) for x in self.stmt_stats.get(key, "0,0,0,0").split(",")]
+            stats.append({
+                "index":        i,
+                "difficulty":   self._get_statement(week, i)["difficulty"],
+                "attempts":     attempts,
+                "correct":      correct,
+                "correct_rate": round(correct / attempts, 3) if attempts else 0,
+                "avg_ai_score": ai_total // ai_scored if ai_scored else 0,
             })
-        return qs
+        return stats
 
     @gl.public.view
-    def get_room_state(self, room_id: str) -> dict:
+    def get_room_state(self, room_id: str, viewer: str = "") -> dict:
+        """
+        Room snapshot. Broadcast rooms list only the top BROADCAST_TOP_K scores
+        plus `viewer`'s own entry instead of every player.
+        """
+        state = self._room_state(room_id, viewer, None)
+        if state is None:
+            raise Exception(f"Room {room_id} not found!")
+        return state
+
+    @gl.public.view
+    def get_rooms_batch(self, room_ids: list, viewer: str = "") -> dict:
+        """
+        get_room_state for up to VIEW_MAX_BATCH rooms in one call: {room_id: state}.
+        Unknown rooms map to None. Statement pools are read once for the whole batch.
+        """
+        if len(room_ids) > VIEW_MAX_BATCH:
+            raise Exception(f"Too many rooms (max {VIEW_MAX_BATCH} per batch)!")
+        memo = {}
+        return {room_id: self._room_state(room_id, viewer, memo) for room_id in room_ids}
+
+    def _room_state(self, room_id: str, viewer: str, memo: dict):
         status = self.room_status.get(room_id, "")
         if not status:
-            raise Exception(f"Room {room_id} not found!")
+            return None
 
-        players   = self._split(self.room_players.get(room_id, ""))
-        round_num = self.room_current_round.get(room_id, "0")
+        broadcast    = self.room_mode.get(room_id, "standard") == "broadcast"
+        player_count = int(self.room_player_count.get(room_id, "0"))
+        round_num    = self.room_current_round.get(room_id, "0")
 
-        scores = {addr: int(self.player_scores.get(f"{room_id}:{addr}", "0")) for addr in players}
+        if broadcast:
+            scores = dict(decode_ranking(self.room_top.get(room_id, "")))
+            if viewer and viewer not in scores and self._is_member(room_id, viewer):
+                scores[viewer] = int(self.player_scores.get(f"{room_id}:{viewer}", "0"))
+            players = list(scores)
+        else:
+            players = self._split(self.room_players.get(room_id, ""))
+            scores  = dict(decode_ranking(self.room_ranking.get(room_id, "")))
 
         state = {
-            "room_id":       room_id,
-            "host":          self.room_host.get(room_id, ""),
-            "players":       players,
-            "player_count":  len(players),
-            "status":        status,
-            "current_round": int(round_num),
-            "total_rounds":  5,
-            "scores":        scores,
+            "room_id":        room_id,
+            "host":           self.room_host.get(room_id, ""),
+            "mode":           "broadcast" if broadcast else "standard",
+            "consensus_mode": self.room_consensus.get(room_id, DEFAULT_CONSENSUS_MODE),
+            "score_tolerance": self._room_tolerance(room_id),
+            "players":        players,
+            "player_count":   player_count,
+            "status":         status,
+            "difficulty":     self.room_difficulty.get(room_id, "mixed"),
+            "max_players":    self._room_capacity(room_id),
+            "current_round":  int(round_num),
+            "total_rounds":   self._room_rounds(room_id),
+            "scores":         scores,
         }
 
         if status == "active" and int(round_num) > 0:
-            week    = int(self.current_week_str)
-            indices = self._split(self.room_statement_indices.get(room_id, ""))
-            stmt    = self._get_statement(week, int(indices[int(round_num) - 1]))
-            state["current_statement"] = stmt["statement"]
-            rnd_key = f"{room_id}:{round_num}"
-            submitted = self._split(self.round_submitted.get(rnd_key, ""))
-            state["submitted_count"] = len(submitted)
-            state["waiting_for"]     = len(players) - len(submitted)
+            _, _, stmt = self._room_statement(room_id, int(round_num), memo)
+            state["current_statement"]  = stmt["statement"]
+            state["current_difficulty"] = stmt["difficulty"]
+            submitted = int(self.round_submit_count.get(f"{room_id}:{round_num}", "0"))
+            state["submitted_count"] = submitted
+            state["waiting_for"]     = player_count - submitted
 
         if status == "finished":
-            state["final_ranking"] = json.loads(self.room_final_ranking.get(room_id, "[]"))
+            ranking = self._ranking_list(self.room_final_ranking.get(room_id, ""))
+            if broadcast:
+                ranking = [e for i, e in enumerate(ranking) if i < BROADCAST_TOP_K or e["player"] == viewer]
+            state["final_ranking"] = ranking
 
         return state
 
+    @gl.public.view
+    def get_round_results(self, room_id: str, round_number: int) -> dict:
+        """Stored results of a scored round (or the chunks judged so far), for reconnecting clients."""
+        value = self.round_results.get(f"{room_id}:{round_number}", "")
+        if not value:
+            raise Exception(f"Round {round_number} of {room_id} has not been scored!")
+
+        _, _, stmt = self._room_statement(room_id, round_number)
+        results    = self._round_results_dict(value)
+        return {
+            "room_id":          room_id,
+            "round_number":     round_number,
+            "correct_answer":   stmt["answer"],
+            "real_explanation": stmt["explanation"],
+            "difficulty":       stmt["difficulty"],
+            "consensus_mode":   self.round_consensus.get(f"{room_id}:{round_number}", ""),
+            "round_results":    results,
+        }
+
+    @gl.public.view
+    def list_open_rooms(self, limit: int = 20) -> list:
+        """Joinable rooms (waiting, with free seats), oldest first."""
+        rooms = []
+        for room_id in self._open_room_ids(max(0, limit)):
+            host  = self.room_host.get(room_id, "")
+            count = int(self.room_player_count.get(room_id, "0"))
+            rooms.append({
+                "room_id":       room_id,
+                "host":          host,
+                "host_nickname": self.profile_nickname.get(host, ""),
+                "difficulty":    self.room_difficulty.get(room_id, "mixed"),
+                "player_count":  count,
+                "seats_left":    self._room_capacity(room_id) - count,
+            })
+        return rooms
+
     @gl.public.view
     def get_player_profile(self, address: str) -> dict:
         """Full on-chain player profile."""
-        games = int(self.profile_games_played.get(address, "0"))
+        return self._profile(address)
+
+    @gl.public.view
+    def get_profiles_batch(self, addresses: list) -> dict:
+        """Profiles for up to VIEW_MAX_BATCH wallets in one call: {address: profile}."""
+        if len(addresses) > VIEW_MAX_BATCH:
+            raise Exception(f"Too many addresses (max {VIEW_MAX_BATCH} per batch)!")
+        return {address: self._profile(address) for address in addresses}
+
+    def _profile(self, address: str) -> dict:
+        join_nonce = self.profile_join_nonce.get(address, "")
         return {
             "address":       address,
             "nickname":      self.profile_nickname.get(address, ""),
-            "join_nonce":    self.profile_join_nonce.get(address, ""),
+            "join_nonce":    join_nonce,
             "last_nonce":    self.profile_last_nonce.get(address, ""),
             "total_xp":      int(self.profile_total_xp.get(address, "0")),
-            "games_played":  games,
+            "games_played":  int(self.profile_games_played.get(address, "0")),
             "wins":          int(self.profile_wins.get(address, "0")),
             "best_score":    int(self.profile_best_score.get(address, "0")),
             "win_streak":    int(self.profile_streak.get(address, "0")),
             "best_streak":   int(self.profile_best_streak.get(address, "0")),
-            "registered":    self.profile_join_nonce.get(address, "") != "",
+            "registered":    join_nonce != "",
         }
 
+    @gl.public.view
+    def find_player_by_nickname(self, nickname: str) -> dict:
+        """Resolve a nickname (case- and spacing-insensitive) to its wallet's profile. One index read."""
+        address = self.nickname_owner.get(normalize_nickname(nickname), "")
+        if not address:
+            return {"found": False, "nickname": nickname.strip()}
+        return {"found": True, **self._profile(address)}
+
+    @gl.public.view
+    def get_player_history(self, address: str, offset: int = 0, limit: int = 10) -> dict:
+        """Finished games for one wallet, newest first. Reads only the requested page."""
+        total = int(self.player_history_count.get(address, "0"))
+        start = total - 1 - max(0, offset)
+        stop  = max(-1, start - max(0, min(limit, 50)))
+        games = []
+        for n in range(start, stop, -1):
+            room_id, week, score, rank = self.player_history.get(f"{address}:{n}", "|0|0|0").split("|")
+            games.append({
+                "room_id": room_id,
+                "week":    int(week),
+                "score":   int(score),
+                "rank":    int(rank),
+            })
+        return {"address": address, "total_games": total, "games": games}
+
     @gl.public.view
     def get_leaderboard(self) -> list:
         """Top 20 players by total XP - reads from on-chain profiles."""
@@ -559,3 +1983,16 @@ Format exactly:
             }
             for i, (addr, xp) in enumerate(entries[:20])
         ]
+
+
+    @gl.public.view
+    def get_weekly_leaderboard(self, week: int = 0, offset: int = 0, limit: int = 20) -> list:
+        """Top players by XP earned in one week (defaults to the current week)."""
+        week = week or int(self.current_week_str)
+        return self._ranked_page(self.weekly_top.get(str(week), ""), offset, limit)
+
+    @gl.public.view
+    def get_season_leaderboard(self, season: int = 0, offset: int = 0, limit: int = 20) -> list:
+        """Top players by XP earned across a season (defaults to the current season)."""
+        season = season or int(self.current_season_str)
+        return self._ranked_page(self.season_top.get(str(season), ""), offset, limit)